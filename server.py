@@ -1,10 +1,15 @@
 import os
 import sys
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
-from src.jira_client import JiraClient, JiraClientError
+from src.async_jira_client import AsyncJiraClient
+from src.dispatch import ToolDispatcher, parse_tool_limits
+from src.jira_client import JiraClientError
+from src.metadata_cache import parse_ttls
 
 # Load environment variables
 load_dotenv()
@@ -19,21 +24,77 @@ logger = logging.getLogger(__name__)
 
 # Initialize Jira client
 try:
-    jira_client = JiraClient(
+    jira_client = AsyncJiraClient(
         url=os.getenv("JIRA_BASE_URL"),
         email=os.getenv("JIRA_EMAIL"),
-        api_token=os.getenv("JIRA_API_TOKEN")
+        api_token=os.getenv("JIRA_API_TOKEN"),
+        project_cache_ttl=float(os.getenv("JIRA_PROJECT_CACHE_TTL", "300")),
+        transition_cache_ttl=float(os.getenv("JIRA_TRANSITION_CACHE_TTL", "3600")),
+        max_search_cursors=int(os.getenv("JIRA_SEARCH_CURSOR_LIMIT", "256")),
+        search_cursor_ttl=float(os.getenv("JIRA_SEARCH_CURSOR_TTL", "600")),
+        search_prefetch=os.getenv("JIRA_SEARCH_PREFETCH", "false").lower() in ("1", "true", "yes"),
+        prefetch_concurrency=int(os.getenv("JIRA_SEARCH_PREFETCH_CONCURRENCY", "4")),
+        prefetch_max_buffered=int(os.getenv("JIRA_SEARCH_PREFETCH_MAX_BUFFERED", "2000")),
+        bulk_concurrency=int(os.getenv("JIRA_BULK_CONCURRENCY", "4")),
+        rate_limit=float(os.getenv("JIRA_RATE_LIMIT", "10")),
+        max_rate_limit=float(os.getenv("JIRA_RATE_LIMIT_MAX", "50")),
+        retry_attempts=int(os.getenv("JIRA_RETRY_ATTEMPTS", "3")),
+        circuit_failure_threshold=int(os.getenv("JIRA_CIRCUIT_FAILURE_THRESHOLD", "5")),
+        circuit_reset_timeout=float(os.getenv("JIRA_CIRCUIT_RESET_TIMEOUT", "30")),
+        idempotency_store=os.getenv("JIRA_IDEMPOTENCY_STORE") or None,
+        idempotency_ttl=float(os.getenv("JIRA_IDEMPOTENCY_TTL", "86400")),
+        timeout=float(os.getenv("JIRA_TIMEOUT", "75")),
+        connect_timeout=float(os.getenv("JIRA_CONNECT_TIMEOUT", "10")),
+        pool_maxsize=int(os.getenv("JIRA_POOL_MAXSIZE", "20")),
+        keepalive_expiry=float(os.getenv("JIRA_KEEPALIVE_EXPIRY", "60")),
+        http2=os.getenv("JIRA_HTTP2", "false").lower() in ("1", "true", "yes"),
+        search_cache_ttl=float(os.getenv("JIRA_SEARCH_CACHE_TTL", "0")),
+        search_cache_stale_ttl=float(os.getenv("JIRA_SEARCH_CACHE_STALE_TTL", "120")),
+        hot_queries=int(os.getenv("JIRA_HOT_QUERIES", "0")),
+        hot_query_interval=float(os.getenv("JIRA_HOT_QUERY_INTERVAL", "20")),
+        metadata_cache_dir=os.getenv("JIRA_METADATA_CACHE_DIR") or None,
+        metadata_cache_ttls=parse_ttls(os.getenv("JIRA_METADATA_CACHE_TTLS", "")),
+        mirror_path=os.getenv("JIRA_MIRROR_PATH") or None,
+        mirror_projects=[p for p in os.getenv("JIRA_MIRROR_PROJECTS", "").split(",") if p.strip()],
+        mirror_sync_interval=float(os.getenv("JIRA_MIRROR_SYNC_INTERVAL", "60")),
+        mirror_reconcile_every=int(os.getenv("JIRA_MIRROR_RECONCILE_EVERY", "10"))
     )
     logger.info("Jira client initialized successfully")
 except Exception as e:
     logger.error(f"Failed to initialize Jira client: {e}")
     sys.exit(1)
 
+# Optional per-tool concurrency caps, so a burst of one slow tool cannot starve the others
+dispatcher = ToolDispatcher(
+    default_limit=int(os.getenv("JIRA_TOOL_CONCURRENCY") or "0"),
+    limits=parse_tool_limits(os.getenv("JIRA_TOOL_LIMITS", ""))
+)
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """
+    Optionally pre-warm Jira connections in the background once the server
+    starts, so the MCP handshake is not delayed and the first tool call does
+    not pay DNS/TCP/TLS setup. Also starts syncing the issue mirror, if configured,
+    and closes the client (background tasks, connection pool, caches) on shutdown.
+    """
+    jira_client.start_mirror_sync()
+    warm_connections = int(os.getenv("JIRA_PREWARM_CONNECTIONS", "0"))
+    warm_up = None
+    if warm_connections > 0:
+        warm_up = asyncio.create_task(jira_client.warm_up(warm_connections))
+    try:
+        yield
+    finally:
+        if warm_up is not None and not warm_up.done():
+            warm_up.cancel()
+        await jira_client.aclose()
+
 # Initialize FastMCP server
-mcp = FastMCP("Jira MCP Server")
+mcp = FastMCP("Jira MCP Server", lifespan=lifespan)
 
 @mcp.tool()
-def create_project(project_name: str, project_key: str, board_type: str = "kanban") -> dict:
+async def create_project(project_name: str, project_key: str, board_type: str = "kanban") -> dict:
     """
     Create a new Jira software project with an associated board.
     
@@ -42,7 +103,7 @@ def create_project(project_name: str, project_key: str, board_type: str = "kanba
     """
     try:
         logger.info(f"Creating {board_type} board: {project_name} ({project_key})")
-        result = jira_client.create_project(project_name, project_key, board_type)
+        result = await dispatcher.run("create_project", jira_client.create_project, project_name, project_key, board_type)
         logger.info("Project created successfully")
         return result
     except JiraClientError as e:
@@ -51,7 +112,7 @@ def create_project(project_name: str, project_key: str, board_type: str = "kanba
 
 
 @mcp.tool()
-def create_issue(
+async def create_issue(
     summary: str,
     project_key: str = "",
     project_name: str = "",
@@ -60,14 +121,21 @@ def create_issue(
     assignee: str = "",
     priority: str = "",
     labels: list = [],
-    due_date: str = ""
+    due_date: str = "",
+    idempotency_key: str = ""
 ) -> dict:
     """
     Create a new Jira issue with optional fields.
+
+    Use assignee "me" to assign the issue to the authenticated user.
+    Pass a unique `idempotency_key` to make retries safe: repeating the call
+    with the same key returns the issue created the first time.
     """
     try:
         logger.info(f"Creating issue: {summary}")
-        result = jira_client.create_issue(
+        result = await dispatcher.run(
+            "create_issue",
+            jira_client.create_issue,
             summary=summary,
             description=description,
             project_key=project_key if project_key else None,
@@ -76,7 +144,8 @@ def create_issue(
             assignee=assignee if assignee else None,
             priority=priority if priority else None,
             labels=labels if labels else None,
-            due_date=due_date if due_date else None
+            due_date=due_date if due_date else None,
+            idempotency_key=idempotency_key if idempotency_key else None
         )
         logger.info(f"Issue created successfully: {result}")
         return result
@@ -85,10 +154,42 @@ def create_issue(
         return {"error": str(e)}
 
 @mcp.tool()
-def search_issues(query: str) -> dict:
+async def create_issues(issues: list) -> dict:
+    """
+    Create many Jira issues in one call.
+
+    Each entry is an object with the same fields as create_issue (summary is
+    required, plus project_key or project_name). Issues are sent in batches of
+    50; the response lists a result per entry in input order, so one invalid
+    entry does not block the others.
+    """
+    try:
+        logger.info(f"Creating {len(issues)} issues in bulk")
+        result = await dispatcher.run("create_issues", jira_client.create_issues, issues)
+        logger.info(f"Bulk create finished: {result['created']} created, {result['failed']} failed")
+        return result
+    except JiraClientError as e:
+        logger.error(f"Failed to create issues: {e}")
+        return {"error": str(e)}
+
+@mcp.tool()
+async def search_issues(query: str = "", limit: int = 10, cursor: str = "", fields: str = "") -> dict:
     """
     Search for Jira issues using JQL (Jira Query Language).
     
+    Returns at most `limit` issues (no more than 100 per call). When more
+    results exist the response has `has_more` set and a `next_cursor`; call
+    again with that cursor (the query may be omitted) to get the next page.
+    Cursors expire after a period of inactivity.
+
+    `fields` picks what each issue contains: "minimal" (summary, status),
+    "triage" (default: adds assignee, type, priority, created), "full"
+    (adds reporter, dates, labels, components, versions, resolution, parent,
+    description), or a comma-separated list of Jira field ids.
+
+    When the first page is served from the server's search cache the response
+    includes `cache_age_seconds`, how long ago it was fetched from Jira.
+
     Examples:
         - 'project = TEST AND status = "To Do"'
         - 'assignee = currentUser() AND priority = High'
@@ -97,7 +198,14 @@ def search_issues(query: str) -> dict:
     """
     try:
         logger.info(f"Searching issues: {query}")
-        result = jira_client.search_issues(query)
+        result = await dispatcher.run(
+            "search_issues",
+            jira_client.search_issues,
+            query,
+            max_results=limit,
+            cursor=cursor if cursor else None,
+            fields=fields if fields else None
+        )
         issue_count = len(result.get("issues", []))
         logger.info(f"Found {issue_count} issues")
         return result
@@ -107,13 +215,41 @@ def search_issues(query: str) -> dict:
 
 
 @mcp.tool()
-def add_comment(issue_id: str, comment: str) -> dict:
+async def get_issues(keys: list, fields: str = "") -> dict:
+    """
+    Get the current state of many Jira issues by key in one call.
+
+    Returns the issues indexed by key, plus a `missing` list of keys that do
+    not exist or are not visible. `fields` accepts the same presets and field
+    lists as search_issues.
+    """
+    try:
+        logger.info(f"Fetching {len(keys)} issues")
+        result = await dispatcher.run("get_issues", jira_client.get_issues, keys, fields=fields if fields else None)
+        logger.info(f"Fetched {result['returned']} issues, {len(result['missing'])} missing")
+        return result
+    except JiraClientError as e:
+        logger.error(f"Failed to get issues: {e}")
+        return {"error": str(e)}
+
+
+@mcp.tool()
+async def add_comment(issue_id: str, comment: str, idempotency_key: str = "") -> dict:
     """
     Add a comment to an existing Jira issue.
+
+    Pass a unique `idempotency_key` to make retries safe: repeating the call
+    with the same key returns the comment added the first time.
     """
     try:
         logger.info(f"Adding comment to {issue_id}")
-        result = jira_client.add_comment(issue_id, comment)
+        result = await dispatcher.run(
+            "add_comment",
+            jira_client.add_comment,
+            issue_id,
+            comment,
+            idempotency_key if idempotency_key else None
+        )
         logger.info(f"Comment added successfully to {issue_id}")
         return result
     except JiraClientError as e:
@@ -121,19 +257,40 @@ def add_comment(issue_id: str, comment: str) -> dict:
         return {"error": str(e)}
 
 @mcp.tool()
-def change_status(issue_id: str, new_status: str) -> dict:
+async def add_comments(comments: list) -> dict:
+    """
+    Add comments to many Jira issues in one call.
+
+    Each entry is an object with `issue_id` and `comment`, and optionally an
+    `idempotency_key` (see add_comment). Comments are posted
+    concurrently; the response lists the comment id or error for every entry
+    in input order, and one failure does not stop the others.
+    """
+    try:
+        logger.info(f"Adding {len(comments)} comments")
+        result = await dispatcher.run("add_comments", jira_client.add_comments, comments)
+        logger.info(f"Bulk comment finished: {result['added']} added, {result['failed']} failed")
+        return result
+    except JiraClientError as e:
+        logger.error(f"Failed to add comments: {e}")
+        return {"error": str(e)}
+
+@mcp.tool()
+async def change_status(issue_id: str, new_status: str) -> dict:
     """
     Change the status/workflow state of a Jira issue.
 
-    The status must be available in the issue's workflow. If the requested status
-    is not available, the response will include a list of valid status options.
+    The status must be available in the issue's workflow. If it is not a direct
+    transition, the issue is moved through the shortest path of intermediate
+    statuses and the response lists the path taken. If the requested status
+    cannot be reached, the response will include a list of valid status options.
     """
     try:
         issue_id = str(issue_id)
         new_status = str(new_status)
         
         logger.info(f"Changing status of {issue_id} to '{new_status}' (type: {type(new_status)})")
-        result = jira_client.change_status(issue_id, new_status)
+        result = await dispatcher.run("change_status", jira_client.change_status, issue_id, new_status)
         logger.info("Status changed successfully")
         return result
     except JiraClientError as e:
@@ -144,6 +301,39 @@ def change_status(issue_id: str, new_status: str) -> dict:
         return {"error": str(e)}
 
 
+@mcp.tool()
+async def change_status_bulk(issue_ids: list, new_status: str) -> dict:
+    """
+    Change the status of many Jira issues to the same target status.
+
+    Issues sharing a workflow and current status are transitioned together
+    (through Jira's bulk transition API where available). The response lists a
+    result per issue in input order, including the status each one came from.
+    """
+    try:
+        issue_ids = [str(issue_id) for issue_id in issue_ids]
+        new_status = str(new_status)
+
+        logger.info(f"Changing status of {len(issue_ids)} issues to '{new_status}'")
+        result = await dispatcher.run("change_status_bulk", jira_client.change_status_bulk, issue_ids, new_status)
+        logger.info(f"Bulk status change finished: {result['changed']} changed, {result['failed']} failed")
+        return result
+    except JiraClientError as e:
+        logger.error(f"Failed to change status in bulk: {e}")
+        return {"error": str(e)}
+
+
+@mcp.tool()
+async def client_metrics() -> dict:
+    """
+    Report operational counters of the Jira client, such as how many
+    identical concurrent reads were coalesced into a single Jira request,
+    the adaptive request rate, circuit breaker state, connection pool
+    saturation, and per-tool concurrency and queue depth.
+    """
+    return {**jira_client.metrics(), "dispatch": dispatcher.stats()}
+
+
 if __name__ == "__main__":
     logger.info("Starting Jira MCP server with FastMCP...")
     mcp.run()
\ No newline at end of file
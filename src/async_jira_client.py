@@ -0,0 +1,1816 @@
+import asyncio
+import logging
+import time
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Iterable, Set, Tuple, Union
+import httpx
+
+from src.bulk import (
+    BULK_API_UNAVAILABLE_STATUSES,
+    BULK_CREATE_BATCH_SIZE,
+    BULK_FETCH_BATCH_SIZE,
+    BULK_TASK_ACTIVE_STATES,
+    BULK_TASK_TIMEOUT,
+    BULK_TRANSITION_LIMIT,
+    DEFAULT_BULK_CONCURRENCY,
+    bulk_create_outcomes,
+    bulk_fetch_errors,
+    bulk_task_outcomes,
+    chunked,
+    error_body,
+)
+from src.idempotency import IdempotencyStore
+from src.issue_fields import resolve_fields, simplify_issue
+from src.issue_mirror import IssueMirror, MIRROR_FIELDS, MIRROR_RECONCILE_PAGE_SIZE
+from src.metadata_cache import MetadataCache
+from src.pool_gauge import PoolGauge
+from src.project_catalog import ProjectCatalog
+from src.rate_limit import AdaptiveRateLimiter, MAX_RATE_LIMIT_RETRIES
+from src.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, RETRYABLE_STATUSES, is_idempotent
+from src.search_cache import SearchCache, normalize_jql, projects_in_jql
+from src.search_cursors import CursorStore, SearchCursor
+from src.single_flight import AsyncSingleFlight, request_key
+from src.workflow_cache import (
+    TransitionCache,
+    WorkflowContext,
+    find_transition,
+    normalize_transitions,
+    project_key_of,
+    workflow_name_for,
+)
+
+logger = logging.getLogger(__name__)
+
+# Assignee values that mean "the user whose credentials the client runs as"
+SELF_ASSIGNEE_ALIASES = {"me", "myself", "currentuser()"}
+
+# Largest page the enhanced JQL search endpoint serves with full fields
+MAX_SEARCH_PAGE_SIZE = 100
+
+# Most issues search_issues returns (and buffers per cursor) in one call
+MAX_SEARCH_RESULTS = 100
+
+# Keys accepted for each entry of create_issues (the create_issue arguments)
+ISSUE_INPUT_KEYS = {
+    "project_key", "project_name", "summary", "description", "issue_type",
+    "assignee", "priority", "labels", "due_date"
+}
+
+# Longest chain of intermediate transitions change_status will walk
+MAX_TRANSITION_HOPS = 10
+
+class JiraClientError(Exception):
+    """Base exception for Jira client errors."""
+    pass
+
+def http_status(error: Exception) -> Optional[int]:
+    """
+    HTTP status code carried by an httpx error, if any.
+    """
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+def write_not_applied(error: BaseException) -> bool:
+    """
+    Whether a failed write provably did not change anything in Jira: it was
+    refused before sending, never reached Jira, or Jira rejected it.
+    """
+    if isinstance(error, (JiraClientError, CircuitOpenError, httpx.ConnectError, httpx.ConnectTimeout)):
+        return True
+    status = http_status(error)
+    return status is not None and status < 500
+
+class AsyncJiraClient:
+    """
+    Jira client built on httpx.AsyncClient.
+
+    Its methods are coroutines so that many tool calls can overlap their Jira
+    round-trips on a single event loop; JiraClient wraps it for blocking callers.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        email: str,
+        api_token: str,
+        timeout: float = 75.0,
+        project_cache_ttl: float = 300.0,
+        transition_cache_ttl: float = 3600.0,
+        max_search_cursors: int = 256,
+        search_cursor_ttl: float = 600.0,
+        search_prefetch: bool = False,
+        prefetch_concurrency: int = 4,
+        prefetch_max_buffered: int = 2000,
+        bulk_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        rate_limit: float = 10.0,
+        max_rate_limit: float = 50.0,
+        retry_attempts: int = 3,
+        circuit_failure_threshold: int = 5,
+        circuit_reset_timeout: float = 30.0,
+        idempotency_store: Optional[str] = None,
+        idempotency_ttl: float = 86400.0,
+        connect_timeout: float = 10.0,
+        pool_maxsize: int = 20,
+        keepalive_expiry: float = 60.0,
+        http2: bool = False,
+        search_cache_ttl: float = 0.0,
+        search_cache_stale_ttl: float = 120.0,
+        hot_queries: int = 0,
+        hot_query_interval: float = 20.0,
+        metadata_cache_dir: Optional[str] = None,
+        metadata_cache_ttls: Optional[Dict[str, float]] = None,
+        mirror_path: Optional[str] = None,
+        mirror_projects: Optional[List[str]] = None,
+        mirror_sync_interval: float = 60.0,
+        mirror_reconcile_every: int = 10,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize async Jira client with credentials.
+
+        Args:
+            url: Jira base URL
+            email: Jira email
+            api_token: Jira API token
+            timeout: Per-request timeout in seconds
+            project_cache_ttl: Seconds the project name index stays fresh
+            transition_cache_ttl: Seconds cached workflow transitions are trusted
+            max_search_cursors: Open search cursors kept before LRU eviction
+            search_cursor_ttl: Seconds an idle search cursor is kept
+            search_prefetch: Fetch the next search page in the background after
+                returning a page, so the follow-up cursor call is served from memory
+            prefetch_concurrency: Prefetches allowed in flight at once
+            prefetch_max_buffered: Issues that may sit in cursor buffers before
+                further prefetches are skipped
+            bulk_concurrency: Requests a bulk method keeps in flight by default
+            rate_limit: Initial requests per second sent to Jira; adapts to
+                429 / Retry-After / X-RateLimit-* responses
+            max_rate_limit: Ceiling the adaptive request rate may grow to
+            retry_attempts: Retries of a failed call (reads on 502/503/504 and
+                transport errors, writes only when the request was never sent)
+            circuit_failure_threshold: Consecutive failures before calls fail fast
+            circuit_reset_timeout: Seconds calls fail fast before Jira is probed again
+            idempotency_store: SQLite file remembering idempotency keys across
+                restarts (in memory when omitted)
+            idempotency_ttl: Seconds an idempotency key is remembered
+            connect_timeout: Seconds allowed to open a connection to Jira
+            pool_maxsize: Connections kept open to Jira; requests beyond this
+                wait for a free connection (reported as pool saturation)
+            keepalive_expiry: Seconds an idle pooled connection is kept open;
+                0 disables keep-alive
+            http2: Negotiate HTTP/2 so concurrent requests multiplex over shared
+                connections (needs the optional ``h2`` package)
+            search_cache_ttl: Seconds a first search page is reused for the same
+                (normalized) JQL; 0 disables the search cache
+            search_cache_stale_ttl: Further seconds a cached page may be served
+                while it is refreshed in the background
+            hot_queries: Most used searches kept refreshed in the background
+                (needs the search cache; 0 disables)
+            hot_query_interval: Seconds between refreshes of the hot searches
+            metadata_cache_dir: Directory persisting projects, boards, the account ID,
+                transitions and workflows across restarts (disabled when omitted)
+            metadata_cache_ttls: Per-namespace TTL overrides for the metadata cache
+            mirror_path: SQLite file holding a local mirror of ``mirror_projects``;
+                searches it can answer are served without calling Jira
+                (disabled when omitted)
+            mirror_projects: Keys of the projects to mirror
+            mirror_sync_interval: Seconds between incremental syncs of the mirror
+            mirror_reconcile_every: Syncs between checks of a mirrored project's
+                full key list, which drop deleted or moved issues
+            transport: httpx transport to send requests through instead of the
+                network (e.g. httpx.MockTransport in tests)
+
+        Raises:
+            JiraClientError: If the client cannot be configured
+        """
+        try:
+            self.url = url.rstrip("/")
+            self.email = email
+            self.projects = ProjectCatalog(ttl=project_cache_ttl)
+            self.transitions = TransitionCache(ttl=transition_cache_ttl)
+            self.search_cache = SearchCache(ttl=search_cache_ttl, stale_ttl=search_cache_stale_ttl)
+            self.hot_queries = hot_queries
+            self.hot_query_interval = hot_query_interval
+            self._hot_query_refresher: Optional[asyncio.Task] = None
+            self.cursors = CursorStore(
+                max_cursors=max_search_cursors, idle_ttl=search_cursor_ttl, lock_factory=asyncio.Lock
+            )
+            self.bulk_concurrency = bulk_concurrency
+            self.idempotency = IdempotencyStore(path=idempotency_store, ttl=idempotency_ttl)
+            self.search_prefetch = search_prefetch
+            self.prefetch_concurrency = prefetch_concurrency
+            self.prefetch_max_buffered = prefetch_max_buffered
+            self._prefetches_in_flight = 0
+            self.single_flight = AsyncSingleFlight()
+            self.rate_limiter = AdaptiveRateLimiter(rate=rate_limit, max_rate=max_rate_limit)
+            self.retry_policy = RetryPolicy(max_retries=retry_attempts)
+            self.circuit_breaker = CircuitBreaker(
+                failure_threshold=circuit_failure_threshold, reset_timeout=circuit_reset_timeout
+            )
+            self._background_tasks = set()
+            self.metadata = MetadataCache(metadata_cache_dir, self.url, ttls=metadata_cache_ttls)
+            self._account_id: Optional[str] = self.metadata.get("users", email)
+            self._account_id_lock = asyncio.Lock()
+            self.mirror: Optional[IssueMirror] = None
+            if mirror_path and mirror_projects:
+                self.mirror = IssueMirror(
+                    mirror_path, mirror_projects,
+                    max_lag=3 * mirror_sync_interval, reconcile_every=mirror_reconcile_every
+                )
+            self.mirror_sync_interval = mirror_sync_interval
+            self._mirror_syncer: Optional[asyncio.Task] = None
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+                    http2 = False
+            self.pool = PoolGauge(pool_maxsize)
+            self.http = httpx.AsyncClient(
+                base_url=self.url,
+                auth=(email, api_token),
+                headers={"Accept": "application/json", "Content-Type": "application/json"},
+                timeout=httpx.Timeout(timeout, connect=connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=pool_maxsize,
+                    max_keepalive_connections=pool_maxsize if keepalive_expiry else 0,
+                    keepalive_expiry=keepalive_expiry or None
+                ),
+                http2=http2,
+                transport=transport
+            )
+            self._restore_project_catalog()
+            logger.info(f"Async Jira client initialized for {email[:3]}***")
+        except Exception as e:
+            logger.error(f"Failed to initialize async Jira client: {str(e)}")
+            raise JiraClientError(f"Failed to initialize Jira client: {str(e)}")
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP connection pool, the metadata cache and the
+        issue mirror.
+        """
+        tasks = list(self._background_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.http.aclose()
+        self.metadata.close()
+        if self.mirror is not None:
+            self.mirror.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Operational counters of the client's concurrency layers.
+        """
+        return {
+            "single_flight": self.single_flight.stats(),
+            "rate_limit": self.rate_limiter.stats(),
+            "retry": self.retry_policy.stats(),
+            "circuit_breaker": self.circuit_breaker.stats(),
+            "connection_pool": self.pool.stats(),
+            "search_cache": self.search_cache.stats(),
+            "metadata_cache": self.metadata.stats(),
+            "issue_mirror": self.mirror.stats() if self.mirror is not None else {"enabled": False}
+        }
+
+    async def _idempotent(
+        self,
+        operation: str,
+        key: Optional[str],
+        request: Dict[str, Any],
+        write: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Run a write at most once per idempotency key.
+
+        A key seen before returns the stored result (flagged ``replayed``);
+        concurrent identical calls with the same key wait for the first one.
+        Reusing a key for a different request is an error, and so is retrying
+        a key whose write failed in a way that may still have reached Jira
+        (timeout, gateway error, cancellation), since repeating it could
+        duplicate the write.
+        """
+        if not key:
+            return await write()
+        fingerprint = request_key("POST", operation, None, request)
+
+        async def run():
+            stored = self.idempotency.claim(operation, key, fingerprint)
+            if stored is not None:
+                if stored[0] != fingerprint:
+                    raise JiraClientError(f"Idempotency key '{key}' was already used for a different {operation} request")
+                if stored[1] is None:
+                    raise JiraClientError(
+                        f"Outcome of the earlier {operation} request with idempotency key '{key}' is unknown "
+                        "(it failed after it may have reached Jira); check Jira before retrying with a new key"
+                    )
+                logger.info(f"Replaying {operation} for idempotency key {key}")
+                return {**stored[1], "replayed": True}
+            try:
+                result = await write()
+            except BaseException as e:
+                if write_not_applied(e):
+                    self.idempotency.release(operation, key)
+                raise
+            self.idempotency.put(operation, key, fingerprint, result)
+            return result
+
+        return await self.single_flight.do(f"idempotency:{operation}:{key}:{fingerprint}", run)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """
+        Run a coroutine in the background, keeping a reference until it finishes.
+        """
+        task = asyncio.get_running_loop().create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        coalesce: Optional[bool] = None
+    ) -> Any:
+        """
+        Send a request to Jira and return the decoded JSON body.
+
+        Reads (GETs, and POSTs flagged with ``coalesce``) that are identical to
+        one already in flight share its response instead of going to Jira
+        again; such results must not be mutated.
+        """
+        if coalesce is None:
+            coalesce = method == "GET"
+        if coalesce:
+            return await self.single_flight.do(
+                request_key(method, path, params, json),
+                lambda: self._send(method, path, params, json)
+            )
+        return await self._send(method, path, params, json)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None
+    ) -> Any:
+        """
+        Send one request through the rate limiter and circuit breaker.
+
+        A 429 is re-sent once the limiter allows (up to MAX_RATE_LIMIT_RETRIES
+        times); gateway errors and transport failures are retried with
+        jittered backoff as the retry policy allows. The circuit breaker
+        admits the call once and counts it as one failure only when its
+        retries are exhausted.
+        """
+        idempotent = is_idempotent(method, path)
+        throttled = 0
+        failures = 0
+        self.circuit_breaker.before_call()
+        while True:
+            delay = self.rate_limiter.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+            try:
+                with self.pool:
+                    response = await self.http.request(method, path, params=params, json=json)
+            except httpx.TransportError as e:
+                never_sent = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if not self.retry_policy.should_retry(failures, idempotent, never_sent=never_sent):
+                    self.circuit_breaker.record_failure()
+                    raise
+                await asyncio.sleep(self.retry_policy.backoff(failures))
+                failures += 1
+                continue
+
+            retry_after = self.rate_limiter.on_response(response.status_code, response.headers)
+            if response.status_code in RETRYABLE_STATUSES:
+                if not self.retry_policy.should_retry(failures, idempotent):
+                    self.circuit_breaker.record_failure()
+                    break
+                await asyncio.sleep(self.retry_policy.backoff(failures))
+                failures += 1
+                continue
+
+            self.circuit_breaker.record_success()
+            if retry_after is None or throttled >= MAX_RATE_LIMIT_RETRIES:
+                break
+            throttled += 1
+        response.raise_for_status()
+        if not response.content:
+            return {}
+        return response.json()
+
+    async def get_current_user_account_id(self) -> str:
+        """
+        Get the account ID of the currently authenticated user.
+
+        The value is fetched from /myself once and memoized for the life of the
+        client, since it cannot change for a fixed set of credentials.
+        """
+        if self._account_id is None:
+            async with self._account_id_lock:
+                if self._account_id is None:
+                    return await self.refresh_current_user_account_id()
+        return self._account_id
+
+    async def refresh_current_user_account_id(self) -> str:
+        """
+        Re-fetch the authenticated user's account ID, replacing the memoized value.
+        """
+        try:
+            myself = await self._request("GET", "/rest/api/2/myself")
+            account_id = myself.get("accountId")
+            if not account_id:
+                raise JiraClientError("Unable to retrieve account ID")
+            logger.info(f"Retrieved account ID: {account_id}")
+            self._account_id = account_id
+            self.metadata.set("users", self.email, account_id)
+            return account_id
+        except JiraClientError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get current user account ID: {str(e)}")
+            raise JiraClientError(f"Failed to get current user account ID: {str(e)}")
+
+    async def warm_up(self, connections: int = 4) -> Dict[str, Any]:
+        """
+        Open pooled connections and load cheap metadata before the first tool call.
+
+        Sends ``connections`` concurrent requests (/myself, which also memoizes
+        the account ID, plus server-info calls that bypass single-flight so each
+        takes its own connection). Failures are logged rather than raised.
+
+        Returns: Connections attempted, failures and elapsed seconds
+        """
+        started = time.monotonic()
+        connections = max(1, connections)
+        results = await asyncio.gather(
+            self.get_current_user_account_id(),
+            *(
+                self._request("GET", "/rest/api/2/serverInfo", coalesce=False)
+                for _ in range(connections - 1)
+            ),
+            return_exceptions=True
+        )
+        failed = [r for r in results if isinstance(r, Exception)]
+        for error in failed[:1]:
+            logger.warning(f"Connection warm-up request failed: {error}")
+        elapsed = round(time.monotonic() - started, 3)
+        logger.info(f"Warmed {connections - len(failed)} of {connections} Jira connections in {elapsed}s")
+        return {"connections": connections, "failed": len(failed), "seconds": elapsed}
+
+    async def create_project(
+        self,
+        project_name: str,
+        project_key: str,
+        board_type: str = "scrum"
+    ) -> Dict[str, Any]:
+        """
+        Create a new Jira project with an associated board.
+
+        Note: Jira doesn't have a direct "create board" API. This creates a software
+        project with a template that automatically includes a board.
+        """
+        try:
+            # Validate project key
+            if not project_key.isupper() or not (2 <= len(project_key) <= 10):
+                raise JiraClientError(
+                    "Project key must be 2-10 uppercase letters (e.g., 'PROJ', 'TEST')"
+                )
+
+            # Determine project template based on board type
+            if board_type.lower() == "kanban":
+                template = "com.pyxis.greenhopper.jira:gh-kanban-template"
+            elif board_type.lower() == "scrum":
+                template = "com.pyxis.greenhopper.jira:gh-scrum-template"
+            else:
+                raise JiraClientError(
+                    f"Invalid board_type '{board_type}'. Must be 'scrum' or 'kanban'"
+                )
+
+            # Get current user's account ID
+            account_id = await self.get_current_user_account_id()
+
+            payload = {
+                "key": project_key,
+                "name": project_name,
+                "projectTypeKey": "software",
+                "projectTemplateKey": template,
+                "leadAccountId": account_id,
+                "assigneeType": "UNASSIGNED"
+            }
+
+            logger.info(f"Creating project: {project_name} ({project_key}) with {board_type} board")
+            result = await self._request("POST", "/rest/api/3/project", json=payload)
+
+            # Make the new project resolvable by name right away
+            self.projects.upsert({"id": result.get("id"), "key": result.get("key"), "name": project_name})
+            self.projects.invalidate()
+
+            # Get the board that was auto-created
+            board_info = await self._get_board_for_project(project_key)
+
+            success_response = {
+                "success": True,
+                "project_key": result.get("key"),
+                "project_id": result.get("id"),
+                "project_url": f"{self.url}/browse/{result.get('key')}",
+                "board_id": board_info.get("id"),
+                "board_url": f"{self.url}/jira/software/c/projects/{project_key}/boards/{board_info.get('id')}",
+                "board_type": board_type,
+                "message": f"Successfully created {board_type} board '{project_name}' with project key {project_key}"
+            }
+
+            logger.info(f"Board created successfully: {success_response}")
+            return success_response
+
+        except JiraClientError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to create board: {str(e)}")
+            raise JiraClientError(f"Failed to create board: {str(e)}")
+
+    async def _get_board_for_project(self, project_key: str) -> Dict[str, Any]:
+        """
+        Get the board associated with a project.
+        """
+        cached = self.metadata.get("boards", project_key)
+        if cached is not None:
+            return cached
+        try:
+            response = await self._request(
+                "GET", "/rest/agile/1.0/board", params={"projectKeyOrId": project_key}
+            )
+            boards = response.get("values", [])
+            if boards:
+                self.metadata.set("boards", project_key, boards[0])
+                return boards[0]  # Return first board
+            return {}
+        except Exception as e:
+            logger.warning(f"Could not retrieve board info: {str(e)}")
+            return {}
+
+    async def _refresh_project_catalog(self) -> None:
+        """
+        Download the project list and rebuild the name/key index.
+        """
+        projects = await self._request("GET", "/rest/api/2/project")
+        self.projects.load(projects)
+        self.metadata.set("projects", "all", projects)
+        logger.info(f"Project catalog refreshed ({len(projects)} projects)")
+
+    def _restore_project_catalog(self) -> None:
+        """
+        Seed the catalog from the metadata cache, marked stale so the first
+        lookup serves it while a refresh runs in the background.
+        """
+        projects = self.metadata.get("projects", "all")
+        if projects:
+            self.projects.load(projects)
+            self.projects.invalidate()
+
+    def _refresh_project_catalog_in_background(self) -> None:
+        """
+        Refresh a stale catalog off the request path; lookups keep using the old index.
+        """
+        if not self.projects.begin_refresh():
+            return
+
+        async def run():
+            try:
+                await self._refresh_project_catalog()
+            except Exception as e:
+                logger.warning(f"Background project catalog refresh failed: {str(e)}")
+            finally:
+                self.projects.end_refresh()
+
+        self._spawn(run())
+
+    async def get_project_key_by_name(self, project_name: str) -> str:
+        """
+        Fetch the project key based on the project name.
+
+        Served from the in-memory project catalog; the project list is only
+        downloaded on first use, after the TTL expires (in the background), or
+        when an unknown name is requested and the index is not brand new.
+        """
+        try:
+            if not self.projects.loaded:
+                await self._refresh_project_catalog()
+            elif self.projects.is_stale():
+                self._refresh_project_catalog_in_background()
+
+            project_key = self.projects.key_for_name(project_name)
+            if project_key is None and self.projects.should_reload_on_miss():
+                await self._refresh_project_catalog()
+                project_key = self.projects.key_for_name(project_name)
+
+            if project_key is None:
+                raise JiraClientError(f"Project '{project_name}' not found")
+            logger.info(f"Found project: {project_name} -> {project_key}")
+            return project_key
+        except JiraClientError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get project key: {str(e)}")
+            raise JiraClientError(f"Failed to get project key: {str(e)}")
+
+    async def _prepare_issue_fields(
+        self,
+        project_key: Optional[str] = None,
+        project_name: Optional[str] = None,
+        summary: str = "",
+        description: str = "",
+        issue_type: str = "Task",
+        assignee: Optional[str] = None,
+        priority: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+        due_date: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Validate issue input and build the Jira ``fields`` payload for it.
+        """
+        if not summary:
+            raise JiraClientError("Summary is required")
+
+        # Resolve project key
+        if not project_key and project_name:
+            project_key = await self.get_project_key_by_name(project_name)
+
+        if not project_key:
+            raise JiraClientError("Either project_key or project_name must be provided")
+
+        fields = {
+            "project": {"key": project_key},
+            "summary": summary,
+            "description": description,
+            "issuetype": {"name": issue_type}
+        }
+
+        # optional fields
+        if assignee and assignee.lower() in SELF_ASSIGNEE_ALIASES:
+            fields["assignee"] = {"accountId": await self.get_current_user_account_id()}
+        elif assignee:
+            fields["assignee"] = {"name": assignee}
+        if priority:
+            fields["priority"] = {"name": priority}
+        if labels:
+            fields["labels"] = labels
+        if due_date:
+            fields["duedate"] = due_date
+        return fields
+
+    async def create_issue(
+        self,
+        project_key: Optional[str] = None,
+        project_name: Optional[str] = None,
+        summary: str = "",
+        description: str = "",
+        issue_type: str = "Task",
+        assignee: Optional[str] = None,
+        priority: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+        due_date: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create a Jira issue with optional fields.
+
+        With an ``idempotency_key``, repeating the call returns the issue created
+        the first time instead of creating a duplicate.
+        """
+        request = {
+            "project_key": project_key,
+            "project_name": project_name,
+            "summary": summary,
+            "description": description,
+            "issue_type": issue_type,
+            "assignee": assignee,
+            "priority": priority,
+            "labels": labels,
+            "due_date": due_date
+        }
+
+        async def create() -> Dict[str, Any]:
+            fields = await self._prepare_issue_fields(**request)
+
+            result = await self._request("POST", "/rest/api/2/issue", json={"fields": fields})
+
+            issue_key = result.get("key")
+            self._invalidate_searches([issue_key])
+            return {
+                "success": True,
+                "issue_key": issue_key,
+                "issue_id": result.get("id"),
+                "issue_url": f"{self.url}/browse/{issue_key}",
+                "message": f"Successfully created issue {issue_key}"
+            }
+
+        try:
+            return await self._idempotent("create_issue", idempotency_key, request, create)
+        except JiraClientError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to create issue: {str(e)}")
+            raise JiraClientError(f"Failed to create issue: {str(e)}")
+
+    async def _post_bulk_create(self, batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Submit one batch of issue field payloads to the bulk-create endpoint.
+
+        When every element is rejected Jira answers with an error status but the
+        usual per-element ``errors`` body; that body is returned, not raised.
+        """
+        payload = {"issueUpdates": [{"fields": fields} for fields in batch]}
+        try:
+            return await self._request("POST", "/rest/api/2/issue/bulk", json=payload)
+        except Exception as e:
+            body = error_body(e)
+            if body.get("errors"):
+                return body
+            raise
+
+    async def create_issues(
+        self,
+        issues: List[Dict[str, Any]],
+        concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Create many issues through the bulk-create endpoint.
+
+        Each entry takes the same keys as create_issue. Entries are validated
+        up front, sent in batches of 50 with up to ``concurrency`` batches
+        (default: the client's bulk concurrency) in flight, and reported
+        individually in input order; one bad entry does not fail the rest.
+        """
+        try:
+            if not issues:
+                raise JiraClientError("At least one issue is required")
+            concurrency = concurrency or self.bulk_concurrency
+
+            results: List[Optional[Dict[str, Any]]] = [None] * len(issues)
+            prepared = []
+            for index, spec in enumerate(issues):
+                try:
+                    if not isinstance(spec, dict):
+                        raise JiraClientError("Each issue must be an object")
+                    unknown = set(spec) - ISSUE_INPUT_KEYS
+                    if unknown:
+                        raise JiraClientError(f"Unknown issue fields: {', '.join(sorted(unknown))}")
+                    prepared.append((index, await self._prepare_issue_fields(**spec)))
+                except JiraClientError as e:
+                    results[index] = {"index": index, "success": False, "error": str(e)}
+
+            limit = asyncio.Semaphore(max(1, concurrency))
+
+            async def run_chunk(chunk):
+                async with limit:
+                    try:
+                        response = await self._post_bulk_create([fields for _, fields in chunk])
+                        outcomes = bulk_create_outcomes(response, len(chunk))
+                    except Exception as e:
+                        logger.error(f"Bulk create request failed: {str(e)}")
+                        outcomes = [{"success": False, "error": f"Bulk create request failed: {str(e)}"}] * len(chunk)
+                for (index, _), outcome in zip(chunk, outcomes):
+                    results[index] = self._bulk_item_result(index, outcome)
+
+            await asyncio.gather(*(run_chunk(chunk) for chunk in chunked(prepared, BULK_CREATE_BATCH_SIZE)))
+
+            self._invalidate_searches([r["issue_key"] for r in results if r["success"]])
+            created = sum(1 for r in results if r["success"])
+            logger.info(f"Bulk created {created} of {len(issues)} issues")
+            return {
+                "success": created == len(issues),
+                "created": created,
+                "failed": len(issues) - created,
+                "results": results
+            }
+        except JiraClientError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to create issues: {str(e)}")
+            raise JiraClientError(f"Failed to create issues: {str(e)}")
+
+    def _bulk_item_result(self, index: int, outcome: Dict[str, Any]) -> Dict[str, Any]:
+        if not outcome["success"]:
+            return {"index": index, "success": False, "error": outcome["error"]}
+        return {
+            "index": index,
+            "success": True,
+            "issue_key": outcome["key"],
+            "issue_id": outcome["id"],
+            "issue_url": f"{self.url}/browse/{outcome['key']}"
+        }
+
+    async def _fetch_search_page(
+        self,
+        jql: str,
+        fields: List[str],
+        max_results: int,
+        page_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch one page from the enhanced JQL search endpoint.
+        """
+        payload = {
+            "jql": jql,
+            "maxResults": max_results,
+            "fields": fields
+        }
+        if page_token:
+            payload["nextPageToken"] = page_token
+        return await self._request("POST", "/rest/api/3/search/jql", json=payload, coalesce=True)
+
+    async def _fetch_search_pages(
+        self,
+        jql: str,
+        fields: List[str],
+        page_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Page through every result of a query straight from Jira (bypassing
+        the search cache and the mirror).
+        """
+        page_token = None
+        while True:
+            page = await self._fetch_search_page(jql, fields, page_size, page_token)
+            yield page
+            page_token = page.get("nextPageToken")
+            if not page_token or page.get("isLast"):
+                return
+
+    def _search_scope(self, jql: str) -> Optional[Set[str]]:
+        """
+        Project keys a query is confined to, or None if it may match any
+        project. Every value must be confirmed as a project key or name by the
+        catalog; an id, or a name the catalog does not know yet, leaves the
+        query unscoped.
+        """
+        projects = projects_in_jql(jql)
+        if projects is None:
+            return None
+        keys = set()
+        for project in projects:
+            matches = {project} if self.projects.project_for_key(project) else set()
+            name_key = self.projects.key_for_name(project)
+            if name_key:
+                matches.add(name_key)
+            if not matches:
+                return None
+            keys |= matches
+        return keys
+
+    async def _fetch_and_cache_search_page(
+        self,
+        key: str,
+        jql: str,
+        fields: List[str],
+        max_results: int
+    ) -> Dict[str, Any]:
+        generation = self.search_cache.generation
+        page = await self._fetch_search_page(jql, fields, max_results)
+        self.search_cache.put(key, self._search_scope(jql), page, generation)
+        return page
+
+    def _refresh_search_page_in_background(
+        self,
+        key: str,
+        jql: str,
+        fields: List[str],
+        max_results: int
+    ) -> None:
+        """
+        Revalidate a stale cached search page off the request path.
+        """
+        if not self.search_cache.begin_refresh(key):
+            return
+
+        async def run():
+            try:
+                await self._fetch_and_cache_search_page(key, jql, fields, max_results)
+            except Exception as e:
+                logger.warning(f"Background search cache refresh failed: {str(e)}")
+            finally:
+                self.search_cache.end_refresh(key)
+
+        self._spawn(run())
+
+    async def _search_page_with_age(
+        self,
+        jql: str,
+        fields: List[str],
+        max_results: int,
+        page_token: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], Optional[float]]:
+        """
+        Fetch one search page, serving first pages from the search cache.
+
+        A stale cached page is returned immediately and refreshed in the
+        background; later pages always come from Jira.
+        Returns: (page, seconds since it was fetched if served from cache, else None)
+        """
+        if self.mirror is not None:
+            self.start_mirror_sync()
+            page = self.mirror.search_page(jql, fields, max_results, page_token, account_id=self._account_id)
+            if page is not None:
+                return page, None
+        if page_token or not self.search_cache.enabled:
+            return await self._fetch_search_page(jql, fields, max_results, page_token), None
+        key = request_key("POST", "search", None, [normalize_jql(jql), fields, max_results])
+        if self.hot_queries:
+            self.search_cache.record_use(key, (jql, fields, max_results))
+            self._start_hot_query_refresher()
+        cached = self.search_cache.get(key)
+        if cached is None:
+            return await self._fetch_and_cache_search_page(key, jql, fields, max_results), None
+        page, age, fresh = cached
+        if not fresh:
+            self._refresh_search_page_in_background(key, jql, fields, max_results)
+        return page, age
+
+    async def _search_page(
+        self,
+        jql: str,
+        fields: List[str],
+        max_results: int,
+        page_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        page, _ = await self._search_page_with_age(jql, fields, max_results, page_token)
+        return page
+
+    async def _refresh_hot_queries(self) -> None:
+        """
+        Re-fetch the most used searches so they keep being served fresh from
+        the cache, then age the popularity counts.
+        """
+        for key, (jql, fields, max_results) in self.search_cache.hottest(self.hot_queries):
+            if not self.search_cache.begin_refresh(key):
+                continue
+            try:
+                await self._fetch_and_cache_search_page(key, jql, fields, max_results)
+            except Exception as e:
+                logger.warning(f"Hot query refresh failed: {str(e)}")
+            finally:
+                self.search_cache.end_refresh(key)
+        self.search_cache.decay()
+
+    def _start_hot_query_refresher(self) -> None:
+        """
+        Start the hot query refresh loop on first use (it needs the running loop).
+        """
+        if self._hot_query_refresher is not None or not self.hot_queries or not self.search_cache.enabled:
+            return
+
+        async def run():
+            while True:
+                await asyncio.sleep(self.hot_query_interval)
+                await self._refresh_hot_queries()
+
+        self._hot_query_refresher = self._spawn(run())
+
+    def _invalidate_searches(self, issue_keys: Iterable[Optional[str]]) -> None:
+        """
+        Drop cached searches that may include the given (just written) issues,
+        and stop serving their projects from the mirror until it has synced.
+        """
+        projects = set()
+        for issue_key in issue_keys:
+            context = self.transitions.issue_context(issue_key or "")
+            project = project_key_of(issue_key or "") or (context[0] if context else None)
+            if project is None:
+                projects = None
+                break
+            projects.add(project)
+        if projects is None or projects:
+            self.search_cache.invalidate(projects)
+            if self.mirror is not None:
+                self.mirror.mark_dirty(projects)
+
+    async def sync_mirror(self) -> Dict[str, int]:
+        """
+        Pull issues updated since each mirrored project's watermark into the
+        local mirror, paging ``updated >=`` JQL through the search endpoint.
+
+        When a project is due for reconciliation its complete key list is then
+        paged as well, and mirrored issues missing from it (deleted, or moved
+        to another project) are removed.
+        Returns: Issues written per project
+        """
+        if self.mirror is None:
+            return {}
+        try:
+            if self.mirror.timezone is None:
+                myself = await self._request("GET", "/rest/api/2/myself")
+                self.mirror.timezone = myself.get("timeZone") or ""
+            synced = {}
+            for project in self.mirror.projects:
+                started = time.time()
+                written = 0
+                pages = self._fetch_search_pages(self.mirror.sync_jql(project), MIRROR_FIELDS, MAX_SEARCH_PAGE_SIZE)
+                async for page in pages:
+                    written += self.mirror.upsert(page.get("issues", []))
+                if self.mirror.needs_reconcile(project):
+                    keys = []
+                    pages = self._fetch_search_pages(f'project = "{project}"', ["id"], MIRROR_RECONCILE_PAGE_SIZE)
+                    async for page in pages:
+                        keys.extend(issue["key"] for issue in page.get("issues", []))
+                    removed = self.mirror.reconcile(project, keys)
+                    if removed:
+                        logger.info(f"Removed {removed} deleted or moved issues from the {project} mirror")
+                self.mirror.mark_synced(project, started)
+                synced[project] = written
+            return synced
+        except JiraClientError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to sync issue mirror: {str(e)}")
+            raise JiraClientError(f"Failed to sync issue mirror: {str(e)}")
+
+    def start_mirror_sync(self) -> None:
+        """
+        Start the mirror sync loop once (it needs the running loop); the first
+        sync runs immediately.
+        """
+        if self._mirror_syncer is not None or self.mirror is None:
+            return
+
+        async def run():
+            while True:
+                try:
+                    synced = await self.sync_mirror()
+                    if any(synced.values()):
+                        logger.info(f"Issue mirror synced: {synced}")
+                except Exception as e:
+                    logger.warning(f"Issue mirror sync failed: {str(e)}")
+                await asyncio.sleep(self.mirror_sync_interval)
+
+        self._mirror_syncer = self._spawn(run())
+
+    async def iter_issues(
+        self,
+        jql: str,
+        fields: Union[str, List[str], None] = None,
+        page_size: int = MAX_SEARCH_PAGE_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream raw issues matching a JQL query, following nextPageToken lazily.
+
+        Only one page is held in memory at a time; the next page is requested
+        when the consumer has iterated past the current one. ``fields`` takes
+        the same presets and field ids as search_issues.
+        """
+        if not jql:
+            raise JiraClientError("Query cannot be empty")
+        fields = resolve_fields(fields)
+        page_size = max(1, min(page_size, MAX_SEARCH_PAGE_SIZE))
+
+        page_token = None
+        while True:
+            try:
+                page = await self._search_page(jql, fields, page_size, page_token)
+            except Exception as e:
+                logger.error(f"Failed to search issues: {str(e)}")
+                raise JiraClientError(f"Failed to search issues: {str(e)}")
+            for issue in page.get("issues", []):
+                yield issue
+            page_token = page.get("nextPageToken")
+            if not page_token or page.get("isLast"):
+                return
+
+    def _prefetch_next_page(self, state: SearchCursor) -> None:
+        """
+        Speculatively fetch the page after the one just returned for a cursor.
+
+        Skipped when prefetch is off, the cursor already has buffered issues,
+        all prefetch slots are busy or the buffer budget would be exceeded.
+        The cursor lock is held while fetching, so a follow-up call that
+        arrives early waits for this page instead of requesting it again.
+        """
+        if not self.search_prefetch or state.done or state.buffered:
+            return
+        if self._prefetches_in_flight >= self.prefetch_concurrency:
+            return
+        if self.cursors.buffered_count() + state.page_size > self.prefetch_max_buffered:
+            return
+        self._prefetches_in_flight += 1
+
+        async def run():
+            try:
+                async with state.lock:
+                    if not state.done and not state.buffered:
+                        page_size = min(state.page_size, MAX_SEARCH_PAGE_SIZE)
+                        state.add_page(await self._search_page(state.jql, state.fields, page_size, state.page_token))
+            except Exception as e:
+                logger.warning(f"Search prefetch failed: {str(e)}")
+            finally:
+                self._prefetches_in_flight -= 1
+
+        self._spawn(run())
+
+    async def search_issues(
+        self,
+        query: str = "",
+        max_results: int = 10,
+        cursor: Optional[str] = None,
+        fields: Union[str, List[str], None] = None
+    ) -> Dict[str, Any]:
+        """
+        Search issues using JQL.
+
+        Returns up to ``max_results`` issues, capped at MAX_SEARCH_RESULTS so a
+        cursor never buffers more than one call's worth. When more remain, the
+        response carries an opaque ``next_cursor`` that maps to pagination
+        state held by the client (query, fields, nextPageToken and any
+        buffered issues); passing it back continues the same search without
+        re-running it.
+
+        ``fields`` selects what is fetched from Jira and emitted per issue: a
+        preset ("minimal", "triage" - the default, "full"), a comma-separated
+        string or a list of field ids. A cursor keeps the fields of the search
+        that created it.
+        """
+        try:
+            if not query and not cursor:
+                raise JiraClientError("Query cannot be empty")
+            if max_results < 1:
+                raise JiraClientError("max_results must be at least 1")
+            max_results = min(max_results, MAX_SEARCH_RESULTS)
+
+            if cursor:
+                state = self.cursors.get(cursor)
+                if state is None:
+                    raise JiraClientError(
+                        "Search cursor expired or unknown; run the search again without a cursor"
+                    )
+                if query and query != state.jql:
+                    raise JiraClientError("Search cursor belongs to a different query")
+            else:
+                state = self.cursors.create(query, resolve_fields(fields))
+
+            async with state.lock:
+                state.page_size = max_results
+                cache_age = None
+                while len(state.buffered) < max_results and not state.done:
+                    page_size = min(max_results - len(state.buffered), MAX_SEARCH_PAGE_SIZE)
+                    page, age = await self._search_page_with_age(
+                        state.jql, state.fields, page_size, state.page_token
+                    )
+                    if age is not None:
+                        cache_age = age
+                    state.add_page(page)
+                issues = state.take(max_results)
+                exhausted = state.exhausted
+            if exhausted:
+                self.cursors.discard(state.cursor_id)
+            else:
+                self._prefetch_next_page(state)
+            issue_count = len(issues)
+
+            # Simplify response
+            simplified_issues = [simplify_issue(issue, self.url, state.fields) for issue in issues]
+            for issue in simplified_issues:
+                self.transitions.remember_issue(
+                    issue["key"], project_key_of(issue["key"] or ""), issue.get("issue_type"), issue.get("status")
+                )
+
+            logger.info(f"Found {issue_count} issues")
+            response = {
+                "success": True,
+                "returned": issue_count,
+                "issues": simplified_issues,
+                "next_cursor": None if exhausted else state.cursor_id,
+                "has_more": not exhausted
+            }
+            if cache_age is not None:
+                response["cache_age_seconds"] = round(cache_age, 1)
+            return response
+        except JiraClientError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to search issues: {str(e)}")
+            raise JiraClientError(f"Failed to search issues: {str(e)}")
+
+    async def get_issues(
+        self,
+        keys: List[str],
+        fields: Union[str, List[str], None] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch the current state of many issues by key.
+
+        Keys are sent to /issue/bulkfetch in chunks of 100 with the requests
+        issued in parallel. ``fields`` takes the same presets and field ids as
+        search_issues.
+        Returns: Simplified issues indexed by key, plus the requested keys that
+        were not found or not accessible
+        """
+        try:
+            keys = list(dict.fromkeys(str(k).strip().upper() for k in keys or [] if str(k).strip()))
+            if not keys:
+                raise JiraClientError("At least one issue key is required")
+            fields = resolve_fields(fields)
+
+            found, errors = await self._bulk_fetch_issues(keys, fields)
+
+            issues = {}
+            missing = []
+            for key in keys:
+                issue = found.get(key)
+                if issue is None:
+                    missing.append(key)
+                    continue
+                simplified = simplify_issue(issue, self.url, fields)
+                issues[simplified["key"]] = simplified
+                self.transitions.remember_issue(
+                    simplified["key"], project_key_of(simplified["key"] or ""),
+                    simplified.get("issue_type"), simplified.get("status")
+                )
+
+            logger.info(f"Fetched {len(issues)} of {len(keys)} issues")
+            return {
+                "success": True,
+                "requested": len(keys),
+                "returned": len(issues),
+                "issues": issues,
+                "missing": missing,
+                "errors": {key: errors[key] for key in missing if key in errors}
+            }
+        except JiraClientError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get issues: {str(e)}")
+            raise JiraClientError(f"Failed to get issues: {str(e)}")
+
+    async def add_comment(
+        self,
+        issue_id: str,
+        comment: str,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Add a comment to a Jira issue.
+
+        With an ``idempotency_key``, repeating the call returns the comment added
+        the first time instead of posting it again.
+        """
+        async def add() -> Dict[str, Any]:
+            result = await self._request(
+                "POST", f"/rest/api/2/issue/{issue_id}/comment", json={"body": comment}
+            )
+            logger.info(f"Comment added to {issue_id}")
+            self._invalidate_searches([issue_id])
+            return {
+                "success": True,
+                "issue_id": issue_id,
+                "comment_id": result.get("id"),
+                "message": f"Successfully added comment to {issue_id}"
+            }
+
+        try:
+            if not issue_id or not comment:
+                raise JiraClientError("Issue ID and comment are required")
+
+            request = {"issue_id": issue_id, "comment": comment}
+            return await self._idempotent("add_comment", idempotency_key, request, add)
+        except JiraClientError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to add comment: {str(e)}")
+            raise JiraClientError(f"Failed to add comment: {str(e)}")
+
+    async def add_comments(
+        self,
+        comments: List[Dict[str, str]],
+        concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Add comments to many issues concurrently.
+
+        Each entry is {"issue_id", "comment"} with an optional
+        "idempotency_key". Up to ``concurrency`` comments (default: the
+        client's bulk concurrency) are posted at once over the shared
+        connection pool; a failed entry is reported without aborting the rest.
+        Returns: Per-entry comment ids or errors in input order
+        """
+        try:
+            if not comments:
+                raise JiraClientError("At least one comment is required")
+            concurrency = concurrency or self.bulk_concurrency
+
+            limit = asyncio.Semaphore(max(1, concurrency))
+
+            async def add_one(index, entry):
+                issue_id = entry.get("issue_id") if isinstance(entry, dict) else None
+                async with limit:
+                    try:
+                        if not isinstance(entry, dict):
+                            raise JiraClientError("Each comment must be an object with issue_id and comment")
+                        result = await self.add_comment(issue_id, entry.get("comment"), entry.get("idempotency_key"))
+                        return {"index": index, "issue_id": issue_id, "success": True, "comment_id": result["comment_id"]}
+                    except JiraClientError as e:
+                        return {"index": index, "issue_id": issue_id, "success": False, "error": str(e)}
+
+            results = await asyncio.gather(*(add_one(index, entry) for index, entry in enumerate(comments)))
+
+            added = sum(1 for r in results if r["success"])
+            logger.info(f"Added {added} of {len(comments)} comments")
+            return {
+                "success": added == len(comments),
+                "added": added,
+                "failed": len(comments) - added,
+                "results": results
+            }
+        except JiraClientError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to add comments: {str(e)}")
+            raise JiraClientError(f"Failed to add comments: {str(e)}")
+
+    async def _fetch_issue_transitions(
+        self, issue_id: str
+    ) -> Tuple[Optional[WorkflowContext], List[Dict[str, str]]]:
+        """
+        Fetch an issue's workflow context and available transitions in one GET,
+        refreshing the transition cache with the result.
+
+        Returns: (context or None, transitions)
+        """
+        issue = await self._request(
+            "GET",
+            f"/rest/api/2/issue/{issue_id}",
+            params={"fields": "status,project,issuetype", "expand": "transitions"}
+        )
+        fields = issue.get("fields", {})
+        transitions = normalize_transitions(issue.get("transitions", []))
+        context = (
+            fields.get("project", {}).get("key"),
+            fields.get("issuetype", {}).get("name"),
+            fields.get("status", {}).get("name")
+        )
+        if not all(context):
+            return None, transitions
+
+        self.transitions.store(context, transitions)
+        self.metadata.set("transitions", "|".join(context), transitions)
+        graph = self.transitions.graph(context)
+        graph.project_id = fields["project"].get("id")
+        graph.issue_type_id = fields["issuetype"].get("id")
+        self.transitions.remember_issue(issue_id, *context)
+        if issue.get("key"):
+            self.transitions.remember_issue(issue["key"], *context)
+        return context, transitions
+
+    async def _post_transition(self, issue_id: str, transition_id: str) -> None:
+        await self._request(
+            "POST",
+            f"/rest/api/2/issue/{issue_id}/transitions",
+            json={"transition": {"id": transition_id}}
+        )
+
+    async def _transition_from_cache(
+        self, issue_id: str, new_status: str
+    ) -> Optional[Tuple[WorkflowContext, Dict[str, str]]]:
+        """
+        Try to perform a status change using only cached workflow data.
+
+        Returns: (context, transition) on success, None on a cache miss or when
+        Jira rejects the cached transition (the stale entries are dropped).
+        """
+        context = self.transitions.issue_context(issue_id)
+        if context is None:
+            return None
+        transitions = self.transitions.lookup(context)
+        if transitions is None:
+            transitions = self.metadata.get("transitions", "|".join(context))
+            if transitions is not None:
+                self.transitions.store(context, transitions)
+        target = find_transition(transitions, new_status) if transitions else None
+        if target is None:
+            return None
+
+        try:
+            await self._post_transition(issue_id, target["id"])
+        except Exception as e:
+            if http_status(e) not in (400, 409):
+                raise
+            logger.info(f"Cached transition {target['id']} rejected for {issue_id}; looking up live")
+            self.transitions.forget_issue(issue_id)
+            self.transitions.invalidate(context)
+            self.metadata.delete("transitions", "|".join(context))
+            return None
+        return context, target
+
+    async def _load_workflow_definition(self, context: WorkflowContext) -> None:
+        """
+        Best-effort load of the full workflow behind a context into its graph.
+
+        Needs permission to read workflow schemes; without it the graph keeps
+        working from observed transitions only. Attempted once per workflow.
+        """
+        graph = self.transitions.graph(context)
+        if graph.definition_attempted:
+            return
+        workflow_key = f"{context[0]}|{context[1]}"
+        cached = self.metadata.get("workflows", workflow_key)
+        if cached is not None:
+            graph.definition_attempted = True
+            for workflow in cached:
+                graph.load_definition(workflow)
+            return
+        if not (graph.project_id and graph.issue_type_id):
+            return
+        graph.definition_attempted = True
+        try:
+            scheme = await self._request(
+                "GET", "/rest/api/3/workflowscheme/project", params={"projectId": graph.project_id}
+            )
+            workflow_name = workflow_name_for(scheme, graph.issue_type_id)
+            if not workflow_name:
+                return
+            found = await self._request(
+                "GET",
+                "/rest/api/3/workflow/search",
+                params={"workflowName": workflow_name, "expand": "transitions,statuses"}
+            )
+            for workflow in found.get("values", []):
+                graph.load_definition(workflow)
+            self.metadata.set("workflows", workflow_key, found.get("values", []))
+            logger.info(f"Loaded workflow '{workflow_name}' for {context[0]}/{context[1]}")
+        except Exception as e:
+            logger.info(f"Workflow definition unavailable for {context[0]}/{context[1]}: {str(e)}")
+
+    async def _walk_workflow(
+        self,
+        issue_id: str,
+        context: Optional[WorkflowContext],
+        transitions: List[Dict[str, str]],
+        new_status: str
+    ) -> List[Dict[str, str]]:
+        """
+        Move an issue to a status that is not a direct transition by following
+        the shortest known path (BFS) through its cached workflow graph.
+
+        Returns: the transitions performed, in order
+        """
+        def unreachable(current: str, options: List[Dict[str, str]]) -> JiraClientError:
+            available = ", ".join(t["name"] for t in options)
+            return JiraClientError(
+                f"Status '{new_status}' not available or reachable from '{current}'. "
+                f"Available transitions: {available}"
+            )
+
+        if context is None:
+            raise unreachable("current status", transitions)
+
+        path = self.transitions.graph(context).shortest_path(context[2], new_status)
+        if path is None:
+            await self._load_workflow_definition(context)
+            path = self.transitions.graph(context).shortest_path(context[2], new_status)
+        if path is None:
+            raise unreachable(context[2], transitions)
+        if len(path) > MAX_TRANSITION_HOPS:
+            raise JiraClientError(
+                f"Status '{new_status}' is {len(path)} transitions away from '{context[2]}' "
+                f"(limit {MAX_TRANSITION_HOPS})"
+            )
+
+        taken = []
+        replanned = False
+        while path:
+            hop = path[0]
+            try:
+                await self._post_transition(issue_id, hop["id"])
+            except Exception as e:
+                if http_status(e) in (400, 409) and not replanned:
+                    # The graph was stale; re-read the issue and plan again once
+                    replanned = True
+                    context, transitions = await self._fetch_issue_transitions(issue_id)
+                    if context is None:
+                        raise unreachable("current status", transitions)
+                    path = self.transitions.graph(context).shortest_path(context[2], new_status)
+                    if path is None:
+                        raise unreachable(context[2], transitions)
+                    continue
+                raise JiraClientError(
+                    f"Failed to change status of {issue_id} after reaching '{context[2]}' "
+                    f"via {len(taken)} transition(s): {str(e)}"
+                )
+            path.pop(0)
+            taken.append(hop)
+            context = (context[0], context[1], hop["to"])
+            self.transitions.remember_issue(issue_id, *context)
+        return taken
+
+    async def change_status(self, issue_id: str, new_status: str) -> Dict[str, Any]:
+        """
+        Change the status/workflow state of a Jira issue.
+
+        When the issue's current status is known (from an earlier search or
+        transition) the transition id is resolved from the transition cache and
+        only the POST is sent; otherwise the transitions are fetched live and
+        cached for the next issue in the same workflow state. If the status is
+        not one transition away, the issue is walked through the shortest path
+        of intermediate statuses in the workflow graph.
+        Returns: Dictionary with status change response and the path taken
+        """
+        try:
+            if not issue_id or not new_status:
+                raise JiraClientError("Issue ID and new status are required")
+
+            cached = await self._transition_from_cache(issue_id, new_status)
+            if cached is not None:
+                context, target = cached
+                path = [target]
+            else:
+                # Get available transitions for this issue
+                context, transitions = await self._fetch_issue_transitions(issue_id)
+                target = find_transition(transitions, new_status)
+                if target:
+                    # Perform the status change
+                    await self._post_transition(issue_id, target["id"])
+                    path = [target]
+                else:
+                    path = await self._walk_workflow(issue_id, context, transitions, new_status)
+
+            if context is not None and path:
+                self.transitions.remember_issue(issue_id, context[0], context[1], path[-1]["to"])
+            if path:
+                self._invalidate_searches([issue_id])
+
+            if not path:
+                message = f"{issue_id} is already in status {new_status}"
+            elif len(path) == 1:
+                message = f"Successfully changed {issue_id} status to {new_status}"
+            else:
+                route = " -> ".join(t["to"] for t in path)
+                message = f"Successfully changed {issue_id} status to {new_status} via {route}"
+            logger.info(message)
+            return {
+                "success": True,
+                "issue_id": issue_id,
+                "new_status": new_status,
+                "transition_id": path[-1]["id"] if path else None,
+                "path": [{"transition": t["name"], "to": t["to"]} for t in path],
+                "message": message
+            }
+        except JiraClientError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to change status: {str(e)}")
+            raise JiraClientError(f"Failed to change status: {str(e)}")
+
+    async def _bulk_fetch_issues(
+        self,
+        keys: List[str],
+        fields: List[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """
+        Fetch many issues by key or id via /issue/bulkfetch, 100 per request,
+        with the requests issued in parallel.
+
+        Returns: (raw issues indexed by both key and id, error messages Jira
+        reported per key); unknown or forbidden keys are absent from the first
+        """
+        limit = asyncio.Semaphore(max(1, self.bulk_concurrency))
+
+        async def fetch(batch):
+            async with limit:
+                return await self._request(
+                    "POST",
+                    "/rest/api/3/issue/bulkfetch",
+                    json={"issueIdsOrKeys": batch, "fields": fields},
+                    coalesce=True
+                )
+
+        pages = await asyncio.gather(*(fetch(batch) for batch in chunked(keys, BULK_FETCH_BATCH_SIZE)))
+
+        found = {}
+        errors = {}
+        for page in pages:
+            for issue in page.get("issues", []):
+                found[str(issue.get("key", "")).upper()] = issue
+                found[str(issue.get("id", ""))] = issue
+            errors.update(bulk_fetch_errors(page))
+        return found, errors
+
+    async def _run_bulk_transition(
+        self,
+        batches: List[Tuple[Dict[str, str], List[Dict[str, Any]]]]
+    ) -> Optional[Tuple[Dict[str, Optional[str]], bool]]:
+        """
+        Submit transitions through Jira Cloud's bulk transition API and poll the
+        resulting task until it finishes.
+
+        Once Jira has accepted the task its outcome is never guessed: if the
+        task cannot be polled or outlives BULK_TASK_TIMEOUT, every issue is
+        reported as pending rather than transitioned again.
+
+        Args:
+            batches: (transition, raw issues) pairs sharing one transition id
+
+        Returns: (issue id -> None on success or an error message, whether the
+        outcome is still pending), or None if the site rejected the submission
+        as unsupported
+        """
+        payload = {
+            "bulkTransitionInputs": [
+                {"selectedIssueIdsOrKeys": [issue["key"] for issue in issues], "transitionId": transition["id"]}
+                for transition, issues in batches
+            ]
+        }
+        issue_ids = [str(issue["id"]) for _, issues in batches for issue in issues]
+        try:
+            submitted = await self._request("POST", "/rest/api/3/bulk/issues/transition", json=payload)
+        except httpx.HTTPStatusError as e:
+            if http_status(e) in BULK_API_UNAVAILABLE_STATUSES:
+                return None
+            raise
+        task_id = submitted.get("taskId")
+        if not task_id:
+            raise JiraClientError("Bulk transition did not return a task id")
+
+        deadline = time.monotonic() + BULK_TASK_TIMEOUT
+        delay = 0.5
+        while True:
+            try:
+                task = await self._request("GET", f"/rest/api/3/bulk/queue/{task_id}")
+            except Exception as e:
+                unknown = f"Bulk transition task {task_id} was accepted but could not be polled: {str(e)}"
+                return {issue_id: unknown for issue_id in issue_ids}, True
+            if task.get("status") not in BULK_TASK_ACTIVE_STATES:
+                return bulk_task_outcomes(task, issue_ids), False
+            if time.monotonic() >= deadline:
+                pending = f"Bulk transition task {task_id} still {task.get('status')} after {BULK_TASK_TIMEOUT:.0f}s"
+                return {issue_id: pending for issue_id in issue_ids}, True
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 5.0)
+
+    async def _transition_each(
+        self,
+        batches: List[Tuple[Dict[str, str], List[Dict[str, Any]]]],
+        concurrency: int
+    ) -> Dict[str, Optional[str]]:
+        """
+        Fallback for sites without the bulk API: POST each known transition
+        individually, with up to ``concurrency`` requests in flight.
+
+        Returns: issue id -> None on success, or an error message
+        """
+        limit = asyncio.Semaphore(max(1, concurrency))
+
+        async def transition(transition_id, issue):
+            async with limit:
+                try:
+                    await self._post_transition(issue["key"], transition_id)
+                    return str(issue["id"]), None
+                except Exception as e:
+                    return str(issue["id"]), str(e)
+
+        return dict(await asyncio.gather(*(
+            transition(t["id"], issue) for t, issues in batches for issue in issues
+        )))
+
+    async def change_status_bulk(
+        self,
+        issue_ids: List[str],
+        new_status: str,
+        concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Move many issues to the same status.
+
+        Issues are fetched in bulk and grouped by workflow and current status, so
+        the transition id is resolved once per group (from the transition cache
+        or one live lookup). Direct transitions are submitted through the bulk
+        transition API and its task is polled to completion; if the site rejects
+        the submission as unsupported they are posted per issue concurrently.
+        Issues of a task whose outcome is unknown are flagged ``pending``.
+        Groups for which the status is not a direct transition go through
+        change_status, which can walk intermediate statuses.
+        Returns: Per-issue results in input order
+        """
+        try:
+            if not issue_ids or not new_status:
+                raise JiraClientError("Issue IDs and new status are required")
+            keys = list(dict.fromkeys(str(k).strip().upper() for k in issue_ids if str(k).strip()))
+            if len(keys) > BULK_TRANSITION_LIMIT:
+                raise JiraClientError(f"At most {BULK_TRANSITION_LIMIT} issues can be transitioned per call")
+            concurrency = concurrency or self.bulk_concurrency
+
+            found, errors = await self._bulk_fetch_issues(keys, ["status", "issuetype", "project"])
+
+            # Outcomes are recorded per issue key; ``resolved`` maps each input
+            # (key or id) to the issue key it refers to
+            outcomes: Dict[str, Dict[str, Any]] = {}
+            resolved: Dict[str, str] = {}
+            groups: Dict[WorkflowContext, List[Dict[str, Any]]] = {}
+            grouped = set()
+            for key in keys:
+                issue = found.get(key)
+                if issue is None:
+                    outcomes[key] = {"success": False, "error": errors.get(key, "Issue not found or not accessible")}
+                    continue
+                resolved[key] = issue["key"].upper()
+                if resolved[key] in grouped:
+                    continue
+                grouped.add(resolved[key])
+                fields = issue.get("fields", {})
+                context = (
+                    fields.get("project", {}).get("key"),
+                    fields.get("issuetype", {}).get("name"),
+                    fields.get("status", {}).get("name")
+                )
+                self.transitions.remember_issue(issue["key"], *context)
+                groups.setdefault(context, []).append(issue)
+
+            batches = []
+            walk = []
+            for context, issues in groups.items():
+                if context[2] and context[2].casefold() == new_status.casefold():
+                    for issue in issues:
+                        outcomes[issue["key"].upper()] = {"success": True, "from_status": context[2], "method": "none"}
+                    continue
+                transitions = self.transitions.lookup(context) if all(context) else None
+                if transitions is None:
+                    try:
+                        _, transitions = await self._fetch_issue_transitions(issues[0]["key"])
+                    except Exception as e:
+                        for issue in issues:
+                            outcomes[issue["key"].upper()] = {
+                                "success": False,
+                                "from_status": context[2],
+                                "error": f"Could not load transitions: {str(e)}"
+                            }
+                        continue
+                target = find_transition(transitions, new_status)
+                if target is None:
+                    walk.extend(issues)
+                else:
+                    batches.append((target, issues))
+
+            if batches:
+                method = "bulk"
+                try:
+                    submitted = await self._run_bulk_transition(batches)
+                except Exception as e:
+                    failed = f"Bulk transition failed: {str(e)}"
+                    submitted = ({str(issue["id"]): failed for _, issues in batches for issue in issues}, False)
+                if submitted is None:
+                    logger.info("Bulk transition API unavailable; transitioning per issue")
+                    transitioned, pending = await self._transition_each(batches, concurrency), False
+                    method = "direct"
+                else:
+                    transitioned, pending = submitted
+                for target, issues in batches:
+                    for issue in issues:
+                        error = transitioned.get(str(issue["id"]))
+                        from_status = issue["fields"]["status"]["name"]
+                        if error is None:
+                            context = self.transitions.issue_context(issue["key"])
+                            if context is not None:
+                                self.transitions.remember_issue(issue["key"], context[0], context[1], target["to"])
+                            outcomes[issue["key"].upper()] = {"success": True, "from_status": from_status, "method": method}
+                        else:
+                            outcome = {"success": False, "from_status": from_status, "error": error}
+                            if pending:
+                                outcome["pending"] = True
+                            outcomes[issue["key"].upper()] = outcome
+
+            limit = asyncio.Semaphore(max(1, concurrency))
+
+            async def change_one(issue):
+                async with limit:
+                    try:
+                        result = await self.change_status(issue["key"], new_status)
+                        return issue, {"success": True, "method": "walk", "path": result["path"]}
+                    except JiraClientError as e:
+                        return issue, {"success": False, "error": str(e)}
+
+            for issue, outcome in await asyncio.gather(*(change_one(issue) for issue in walk)):
+                outcome["from_status"] = issue["fields"]["status"]["name"]
+                outcomes[issue["key"].upper()] = outcome
+
+            self._invalidate_searches(
+                [key for key, outcome in outcomes.items() if outcome["success"] or outcome.get("pending")]
+            )
+            results = [
+                {"issue_id": key, "new_status": new_status, **outcomes[resolved.get(key, key)]}
+                for key in keys
+            ]
+            changed = sum(1 for r in results if r["success"])
+            logger.info(f"Bulk status change to {new_status}: {changed} of {len(keys)} succeeded")
+            return {
+                "success": changed == len(keys),
+                "changed": changed,
+                "failed": len(keys) - changed,
+                "results": results
+            }
+        except JiraClientError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to change status in bulk: {str(e)}")
+            raise JiraClientError(f"Failed to change status in bulk: {str(e)}")
@@ -0,0 +1,126 @@
+from typing import Optional, List, Dict, Any, TypeVar
+
+T = TypeVar("T")
+
+# Largest batch accepted by POST /rest/api/2/issue/bulk
+BULK_CREATE_BATCH_SIZE = 50
+
+# Bulk requests a single call keeps in flight at once
+DEFAULT_BULK_CONCURRENCY = 4
+
+# Issue keys per POST /rest/api/3/issue/bulkfetch request
+BULK_FETCH_BATCH_SIZE = 100
+
+# Issues accepted by one POST /rest/api/3/bulk/issues/transition submission
+BULK_TRANSITION_LIMIT = 1000
+
+# Seconds to wait for a bulk transition task before reporting it as pending
+BULK_TASK_TIMEOUT = 120.0
+
+# Rejections of a bulk transition submission meaning the site lacks the API
+BULK_API_UNAVAILABLE_STATUSES = {404, 405, 501}
+
+# Bulk task states that mean "still working"
+BULK_TASK_ACTIVE_STATES = {"ENQUEUED", "RUNNING"}
+
+
+def chunked(items: List[T], size: int) -> List[List[T]]:
+    """
+    Split a list into consecutive chunks of at most ``size`` items.
+    """
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def element_error_message(error: Dict[str, Any]) -> str:
+    """
+    Render one entry of a bulk response's ``errors`` list as a readable message.
+    """
+    element = error.get("elementErrors", {})
+    messages = list(element.get("errorMessages", []))
+    messages.extend(f"{field}: {message}" for field, message in element.get("errors", {}).items())
+    return "; ".join(messages) or f"Failed with status {error.get('status', 'unknown')}"
+
+
+def bulk_create_outcomes(response: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+    """
+    Map a bulk-create response back onto the ``count`` submitted elements.
+
+    Jira lists the created issues in submission order, skipping failed
+    elements, and reports each failure with its ``failedElementNumber``.
+
+    Returns: one {"success": True, "id", "key"} or {"success": False, "error"}
+    per submitted element, in submission order
+    """
+    failures = {
+        error.get("failedElementNumber"): element_error_message(error)
+        for error in response.get("errors", [])
+    }
+    created = iter(response.get("issues", []))
+    outcomes = []
+    for position in range(count):
+        if position in failures:
+            outcomes.append({"success": False, "error": failures[position]})
+            continue
+        issue = next(created, None)
+        if issue is None:
+            outcomes.append({"success": False, "error": "Not reported in bulk response"})
+        else:
+            outcomes.append({"success": True, "id": issue.get("id"), "key": issue.get("key")})
+    return outcomes
+
+
+def error_body(error: Exception) -> Dict[str, Any]:
+    """
+    Decoded JSON body of a failed HTTP response, or {} if there is none.
+    """
+    response = getattr(error, "response", None)
+    try:
+        body = response.json()
+    except Exception:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
+def task_error_message(errors: Any) -> str:
+    """
+    Render the per-issue error entry of a bulk task as a readable message.
+    """
+    if isinstance(errors, dict):
+        messages = list(errors.get("errorMessages", []))
+        messages.extend(f"{field}: {message}" for field, message in errors.get("errors", {}).items())
+        return "; ".join(messages) or "Transition failed"
+    if isinstance(errors, list):
+        return "; ".join(task_error_message(e) for e in errors) or "Transition failed"
+    return str(errors)
+
+
+def bulk_task_outcomes(task: Dict[str, Any], issue_ids: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Map a finished bulk task onto the submitted issue ids.
+
+    Returns: issue id -> None on success, or an error message
+    """
+    processed = {str(i) for i in task.get("processedAccessibleIssues", [])}
+    failed = {str(k): v for k, v in (task.get("failedAccessibleIssues") or {}).items()}
+    outcomes = {}
+    for issue_id in issue_ids:
+        if issue_id in processed:
+            outcomes[issue_id] = None
+        elif issue_id in failed:
+            outcomes[issue_id] = task_error_message(failed[issue_id])
+        else:
+            outcomes[issue_id] = f"Not processed by bulk task (status {task.get('status', 'unknown')})"
+    return outcomes
+
+
+def bulk_fetch_errors(page: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Per-key error messages from the ``issueErrors`` of a bulkfetch response.
+    """
+    errors = {}
+    for error in page.get("issueErrors", []):
+        message = error.get("errorMessage") or "Issue not found or not accessible"
+        for target in error.get("issueIdsOrKeys") or [error.get("id")]:
+            if target:
+                errors[str(target).upper()] = message
+    return errors
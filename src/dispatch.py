@@ -0,0 +1,92 @@
+import asyncio
+from typing import Optional, Dict, Any, Awaitable, Callable
+
+
+def parse_tool_limits(spec: str) -> Dict[str, int]:
+    """
+    Parse a "tool=limit,tool=limit" setting, skipping malformed entries.
+    """
+    limits = {}
+    for entry in (spec or "").split(","):
+        name, _, value = entry.partition("=")
+        if name.strip() and value.strip().isdigit() and int(value) > 0:
+            limits[name.strip()] = int(value)
+    return limits
+
+
+class _ToolGate:
+    def __init__(self, limit: Optional[int]):
+        self.limit = limit
+        self.semaphore = asyncio.Semaphore(limit) if limit else None
+        self.calls = 0
+        self.queued = 0
+        self.peak_queued = 0
+        self.in_flight = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "calls": self.calls,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued
+        }
+
+
+class ToolDispatcher:
+    """
+    Runs tool calls (coroutines) under optional per-tool concurrency caps.
+
+    A tool with a cap (from ``limits``, else ``default_limit``) queues calls
+    beyond it, so a burst of one slow tool cannot starve the others of Jira's
+    rate limit and connections. Tools without a cap run unthrottled and are
+    only counted.
+    """
+
+    def __init__(
+        self,
+        default_limit: Optional[int] = None,
+        limits: Optional[Dict[str, int]] = None
+    ):
+        """
+        Args:
+            default_limit: Concurrent calls allowed per tool without an
+                explicit limit (None or 0: unlimited)
+            limits: Tool name -> concurrent calls allowed
+        """
+        self.default_limit = default_limit or None
+        self.limits = dict(limits or {})
+        self._gates: Dict[str, _ToolGate] = {}
+
+    def _gate(self, tool: str) -> _ToolGate:
+        gate = self._gates.get(tool)
+        if gate is None:
+            gate = self._gates[tool] = _ToolGate(self.limits.get(tool, self.default_limit))
+        return gate
+
+    async def run(self, tool: str, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """
+        Await ``fn`` once a slot for ``tool`` is free and return its result.
+        """
+        gate = self._gate(tool)
+        gate.calls += 1
+        if gate.semaphore is not None and gate.semaphore.locked():
+            gate.queued += 1
+            gate.peak_queued = max(gate.peak_queued, gate.queued)
+            try:
+                await gate.semaphore.acquire()
+            finally:
+                gate.queued -= 1
+        elif gate.semaphore is not None:
+            await gate.semaphore.acquire()
+
+        gate.in_flight += 1
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            gate.in_flight -= 1
+            if gate.semaphore is not None:
+                gate.semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"tools": {tool: gate.stats() for tool, gate in sorted(self._gates.items())}}
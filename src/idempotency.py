@@ -0,0 +1,88 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, Any, Callable, Tuple
+
+
+class IdempotencyStore:
+    """
+    Remembers the result of writes made under a client-supplied idempotency key.
+
+    A retried create_issue / add_comment carrying the same key gets the stored
+    result back instead of creating a duplicate. A key is claimed before its
+    write is sent, so a retry of a write whose outcome is unknown is refused
+    rather than repeated. Entries live in SQLite (a file when ``path`` is
+    given, so they survive restarts; in memory otherwise) and expire after
+    ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = 86400.0,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            path: SQLite database file, or None to keep keys in memory only
+            ttl: Seconds a key is remembered
+            clock: Wall-clock time source (entries may outlive the process)
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS idempotency ("
+                " operation TEXT NOT NULL, key TEXT NOT NULL, fingerprint TEXT NOT NULL,"
+                " result TEXT NOT NULL, created_at REAL NOT NULL,"
+                " PRIMARY KEY (operation, key))"
+            )
+
+    def claim(self, operation: str, key: str, fingerprint: str) -> Optional[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Reserve a key before its write is sent, dropping expired keys on the way.
+
+        The key is recorded as pending (no result) so that a retry arriving
+        while the outcome is unknown - the write timed out or was cancelled
+        after it may have reached Jira - is not sent a second time.
+
+        Returns: None if the key was free and is now reserved, else the live
+        entry as (request fingerprint, stored result or None while pending)
+        """
+        now = self._clock()
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM idempotency WHERE created_at <= ?", (now - self.ttl,))
+            claimed = self._db.execute(
+                "INSERT OR IGNORE INTO idempotency VALUES (?, ?, ?, 'null', ?)",
+                (operation, key, fingerprint, now)
+            ).rowcount
+            if claimed:
+                return None
+            row = self._db.execute(
+                "SELECT fingerprint, result FROM idempotency WHERE operation = ? AND key = ?",
+                (operation, key)
+            ).fetchone()
+        return row[0], json.loads(row[1])
+
+    def release(self, operation: str, key: str) -> None:
+        """
+        Free a pending key whose write provably did not happen.
+        """
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM idempotency WHERE operation = ? AND key = ? AND result = 'null'",
+                (operation, key)
+            )
+
+    def put(self, operation: str, key: str, fingerprint: str, result: Dict[str, Any]) -> None:
+        """
+        Record the result of a completed write.
+        """
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO idempotency VALUES (?, ?, ?, ?, ?)",
+                (operation, key, fingerprint, json.dumps(result), self._clock())
+            )
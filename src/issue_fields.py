@@ -0,0 +1,115 @@
+from typing import Optional, List, Dict, Any, Callable, Tuple, Union
+
+# Named field sets accepted wherever search fields are requested
+FIELD_PRESETS = {
+    "minimal": ["summary", "status"],
+    "triage": ["summary", "status", "assignee", "issuetype", "priority", "created"],
+    "full": [
+        "summary", "status", "assignee", "reporter", "issuetype", "priority",
+        "created", "updated", "duedate", "labels", "components", "fixVersions",
+        "resolution", "parent", "description"
+    ],
+}
+
+DEFAULT_FIELD_PRESET = "triage"
+
+
+def adf_to_text(value: Any) -> Any:
+    """
+    Flatten an Atlassian Document Format body (as returned by API v3) to plain text.
+    Non-ADF values are returned unchanged.
+    """
+    if not isinstance(value, dict) or value.get("type") != "doc":
+        return value
+
+    blocks = []
+
+    def walk(node: Dict[str, Any], out: List[str]) -> None:
+        if node.get("type") == "text":
+            out.append(node.get("text", ""))
+        elif node.get("type") == "hardBreak":
+            out.append("\n")
+        for child in node.get("content", []):
+            walk(child, out)
+
+    for block in value.get("content", []):
+        parts: List[str] = []
+        walk(block, parts)
+        blocks.append("".join(parts))
+    return "\n".join(blocks)
+
+
+def _name(value: Any) -> Optional[str]:
+    return value.get("name") if isinstance(value, dict) else None
+
+
+def _names(value: Any) -> List[str]:
+    return [item.get("name") for item in value or [] if isinstance(item, dict)]
+
+
+def _display_name(value: Any) -> Optional[str]:
+    return value.get("displayName") if isinstance(value, dict) else None
+
+
+# Jira field id -> (key in the simplified issue, value formatter)
+FIELD_FORMATTERS: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    "summary": ("summary", lambda v: v),
+    "status": ("status", _name),
+    "assignee": ("assignee", lambda v: _display_name(v) or "Unassigned"),
+    "reporter": ("reporter", _display_name),
+    "issuetype": ("issue_type", _name),
+    "priority": ("priority", lambda v: _name(v) or "None"),
+    "created": ("created", lambda v: v),
+    "updated": ("updated", lambda v: v),
+    "duedate": ("due_date", lambda v: v),
+    "labels": ("labels", lambda v: v or []),
+    "components": ("components", _names),
+    "fixVersions": ("fix_versions", _names),
+    "resolution": ("resolution", _name),
+    "parent": ("parent", lambda v: v.get("key") if isinstance(v, dict) else None),
+    "description": ("description", adf_to_text),
+}
+
+
+def resolve_fields(fields: Union[str, List[str], None] = None) -> List[str]:
+    """
+    Expand a field selection into the list of Jira field ids to request.
+
+    Accepts a preset name ("minimal", "triage", "full"), a comma-separated
+    string, or a list; presets may be mixed with individual field ids.
+    """
+    if not fields:
+        return list(FIELD_PRESETS[DEFAULT_FIELD_PRESET])
+    if isinstance(fields, str):
+        fields = fields.split(",")
+
+    resolved: List[str] = []
+    for field in fields:
+        field = field.strip()
+        for name in FIELD_PRESETS.get(field.lower(), [field] if field else []):
+            if name not in resolved:
+                resolved.append(name)
+    return resolved or list(FIELD_PRESETS[DEFAULT_FIELD_PRESET])
+
+
+def simplify_issue(
+    issue: Dict[str, Any],
+    base_url: str,
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Flatten a raw Jira search hit into the compact shape returned by the tools.
+
+    Only the requested fields are emitted (the default preset when omitted);
+    fields without a known formatter are passed through under their Jira id.
+    """
+    raw = issue.get("fields", {})
+    simplified = {"key": issue.get("key")}
+    for field in fields or FIELD_PRESETS[DEFAULT_FIELD_PRESET]:
+        if field in FIELD_FORMATTERS:
+            name, formatter = FIELD_FORMATTERS[field]
+            simplified[name] = formatter(raw.get(field))
+        else:
+            simplified[field] = raw.get(field)
+    simplified["url"] = f"{base_url}/browse/{issue.get('key')}"
+    return simplified
@@ -0,0 +1,458 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Callable, Iterable
+
+from src.issue_fields import FIELD_PRESETS
+
+# Fields stored for mirrored issues; searches asking for anything else go to Jira
+MIRROR_FIELDS = list(FIELD_PRESETS["full"])
+
+# Prefix of page tokens handed out for searches served by the mirror
+MIRROR_PAGE_TOKEN = "mirror:"
+
+# Page size requested when listing a project's keys for reconciliation
+MIRROR_RECONCILE_PAGE_SIZE = 1000
+
+_TOKENS = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|!=|=|\(|\)|,|[^\s=!(),"\']+')
+
+# JQL field -> JSON path of its name-like value
+_NAME_FIELDS = {
+    "status": "$.fields.status.name",
+    "issuetype": "$.fields.issuetype.name",
+    "type": "$.fields.issuetype.name",
+    "priority": "$.fields.priority.name",
+    "resolution": "$.fields.resolution.name",
+}
+
+_USER_FIELDS = {"assignee", "reporter"}
+
+_ORDER_COLUMNS = {
+    "created": ["created"],
+    "updated": ["updated"],
+    "key": ["project", "number"],
+}
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z").timestamp()
+    except ValueError:
+        return None
+
+
+def _unquote(token: str) -> str:
+    if token[:1] in "\"'":
+        return token[1:-1].replace("\\" + token[0], token[0])
+    return token
+
+
+class _Query:
+    """
+    Translation of a JQL query into SQL over the mirror, for the supported subset:
+    ``AND``-joined clauses on project, key, status, issuetype, priority,
+    resolution, assignee, reporter and labels using =, !=, in, not in,
+    is [not] EMPTY (EMPTY / NULL / Unresolved values included), plus ORDER BY
+    created, updated or key. Anything else (OR, functions, ids, negated
+    labels, ...) raises ValueError so the query goes to Jira.
+    """
+
+    def __init__(self, jql: str, account_id: Optional[str]):
+        self.account_id = account_id
+        self.tokens = _TOKENS.findall(jql)
+        self.pos = 0
+        self.projects: List[str] = []
+        self.where: List[str] = []
+        self.params: List[Any] = []
+        self.order: List[str] = []
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def next(self) -> str:
+        token = self.peek()
+        if token is None:
+            raise ValueError("unexpected end of query")
+        self.pos += 1
+        return token
+
+    def keyword(self, *words: str) -> bool:
+        token = self.peek()
+        if token is not None and token.lower() in words:
+            self.pos += 1
+            return True
+        return False
+
+    def value(self) -> Optional[str]:
+        """
+        Next value; None stands for EMPTY / NULL.
+        """
+        token = self.next()
+        if token.lower() == "currentuser" and self.peek() == "(":
+            self.next()
+            if self.next() != ")" or self.account_id is None:
+                raise ValueError("currentUser() needs the account id")
+            return self.account_id
+        if token in ("(", ")", ",", "=", "!="):
+            raise ValueError(f"unexpected {token}")
+        if token.lower() in ("empty", "null"):
+            return None
+        if self.peek() == "(":
+            raise ValueError(f"function {token}() is not served locally")
+        return _unquote(token)
+
+    def values(self) -> List[Optional[str]]:
+        if self.next() != "(":
+            raise ValueError("expected (")
+        values = [self.value()]
+        while self.keyword(","):
+            values.append(self.value())
+        if self.next() != ")":
+            raise ValueError("expected )")
+        return values
+
+    def parse(self) -> "_Query":
+        if self.peek() is not None and self.peek().lower() != "order":
+            self.clause()
+            while self.keyword("and"):
+                self.clause()
+        if self.keyword("order"):
+            if not self.keyword("by"):
+                raise ValueError("expected BY")
+            self.order_term()
+            while self.keyword(","):
+                self.order_term()
+        if self.peek() is not None:
+            raise ValueError(f"unsupported JQL near {self.peek()}")
+        return self
+
+    def order_term(self) -> None:
+        columns = _ORDER_COLUMNS.get(self.next().lower())
+        if columns is None:
+            raise ValueError("unsupported ORDER BY field")
+        direction = "DESC" if self.keyword("desc") else "ASC"
+        self.keyword("asc")
+        self.order.extend(f"{column} {direction}" for column in columns)
+
+    def clause(self) -> None:
+        field = self.next().lower()
+        if self.keyword("is"):
+            negate = self.keyword("not")
+            if self.next().lower() not in ("empty", "null"):
+                raise ValueError("only IS [NOT] EMPTY is supported")
+            values: List[Optional[str]] = [None]
+        else:
+            negate = self.keyword("not")
+            if negate or self.keyword("in"):
+                if negate and not self.keyword("in"):
+                    raise ValueError("expected IN")
+                values = self.values()
+            else:
+                operator = self.next()
+                if operator not in ("=", "!="):
+                    raise ValueError(f"unsupported operator {operator}")
+                negate = operator == "!="
+                values = [self.value()]
+
+        if field == "project":
+            if negate or None in values:
+                raise ValueError("negated or empty project clauses are not served locally")
+            self.projects.extend(value.upper() for value in values)
+            return
+        self.match(field, values, negate)
+
+    def match(self, field: str, values: List[Optional[str]], negate: bool) -> None:
+        """
+        Add the condition for ``field`` matching (or, negated, not matching)
+        any of ``values``, with JQL's semantics: a negated clause never
+        matches an empty field unless EMPTY is among the values.
+        """
+        if field == "resolution":
+            values = [None if value is not None and value.lower() == "unresolved" else value for value in values]
+        names = [value.lower() for value in values if value is not None]
+        empty = len(names) < len(values)
+        if field in ("key", *_NAME_FIELDS) and any(name.isdigit() for name in names):
+            raise ValueError(f"{field} ids are not served locally")
+        if field == "labels" and negate and names:
+            raise ValueError("negated labels clauses are not served locally")
+
+        marks = ", ".join("?" for _ in names)
+        if field == "key":
+            if empty:
+                raise ValueError("key is never empty")
+            nullable = None
+            condition = f"lower(key) IN ({marks})"
+            params: List[Any] = names
+        elif field in _NAME_FIELDS:
+            path = _NAME_FIELDS[field]
+            nullable = ("json_extract(data, ?)", [path])
+            condition = f"lower(json_extract(data, ?)) IN ({marks})"
+            params = [path] + names
+        elif field in _USER_FIELDS:
+            nullable = ("json_extract(data, ?)", [f"$.fields.{field}.accountId"])
+            paths = [f"$.fields.{field}.{attr}" for attr in ("accountId", "displayName", "emailAddress")]
+            # A user may lack some of these attributes; a NULL would void NOT (... OR ...)
+            condition = "(" + " OR ".join(
+                f"coalesce(lower(json_extract(data, ?)), '') IN ({marks})" for _ in paths
+            ) + ")"
+            params = [p for path in paths for p in [path] + names]
+        elif field == "labels":
+            nullable = ("json_extract(data, '$.fields.labels[0]')", [])
+            condition = (
+                "EXISTS (SELECT 1 FROM json_each(json_extract(data, '$.fields.labels'))"
+                f" WHERE lower(value) IN ({marks}))"
+            )
+            params = names
+        else:
+            raise ValueError(f"unsupported field {field}")
+
+        parts: List[str] = []
+        part_params: List[Any] = []
+        if names:
+            parts.append(f"NOT {condition}" if negate else condition)
+            part_params.extend(params)
+        if nullable is not None and (negate or empty):
+            # A negated clause excludes empty values whether or not EMPTY is
+            # listed (JQL's != and NOT IN never match an empty field)
+            parts.append(f"{nullable[0]} IS {'NOT ' if negate else ''}NULL")
+            part_params.extend(nullable[1])
+        joiner = " AND " if negate else " OR "
+        self.where.append("(" + joiner.join(parts) + ")")
+        self.params.extend(part_params)
+
+
+class IssueMirror:
+    """
+    Local SQLite (WAL) copy of the issues of selected projects.
+
+    An incremental sync (driven by the owning client) pulls issues updated
+    since each project's watermark; searches whose JQL falls in the supported
+    subset and only touches fresh mirrored projects are answered from SQLite
+    without a Jira round-trip. A project is not served while it lags behind by
+    more than ``max_lag`` seconds or after a write through this process until
+    the next sync catches up. On its first sync and every ``reconcile_every``
+    syncs after that, a project is also reconciled against the full list of
+    its issue keys, dropping issues that were deleted or moved away.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        projects: List[str],
+        max_lag: float = 180.0,
+        reconcile_every: int = 10,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            path: SQLite database file
+            projects: Keys of the projects to mirror
+            max_lag: Seconds since the last completed sync after which a
+                project is no longer served locally
+            reconcile_every: Syncs of a project between two reconciliations
+            clock: Wall-clock time source
+        """
+        self.projects = [project.strip().upper() for project in projects if project.strip()]
+        self.max_lag = max_lag
+        self.reconcile_every = max(1, reconcile_every)
+        # Jira user's time zone, set by the client before syncing
+        self.timezone: Optional[str] = None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._dirty_at: Dict[str, float] = {}
+        self._synced_at: Dict[str, float] = {}
+        self._syncs: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.removed = 0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS issues ("
+                " key TEXT PRIMARY KEY, project TEXT NOT NULL, number INTEGER NOT NULL,"
+                " created REAL, updated REAL, data TEXT NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS issues_project_updated ON issues (project, updated)")
+
+    def upsert(self, issues: List[Dict[str, Any]]) -> int:
+        """
+        Store raw issues (as returned by search), replacing older copies.
+
+        Returns: number of issues written
+        """
+        rows = []
+        for issue in issues:
+            key = str(issue.get("key") or "").upper()
+            project, _, number = key.rpartition("-")
+            if not project or not number.isdigit():
+                continue
+            fields = issue.get("fields", {})
+            rows.append((
+                key,
+                project,
+                int(number),
+                _parse_timestamp(fields.get("created")),
+                _parse_timestamp(fields.get("updated")),
+                json.dumps({"key": key, "id": issue.get("id"), "fields": fields})
+            ))
+        with self._lock, self._db:
+            self._db.executemany("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def sync_jql(self, project: str) -> str:
+        """
+        JQL selecting what the next incremental sync of a project must fetch.
+
+        The watermark is the newest ``updated`` already mirrored, rendered in
+        the Jira user's time zone (how JQL interprets dates) and moved back a
+        minute because JQL dates have minute resolution. Without a known time
+        zone a day of overlap is used instead.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT MAX(updated) FROM issues WHERE project = ?", (project,)).fetchone()
+        jql = f'project = "{project}"'
+        if row and row[0] is not None:
+            zone, overlap = timezone.utc, timedelta(days=1)
+            if self.timezone:
+                try:
+                    from zoneinfo import ZoneInfo
+                    zone, overlap = ZoneInfo(self.timezone), timedelta(minutes=1)
+                except Exception:
+                    pass
+            since = datetime.fromtimestamp(row[0], zone) - overlap
+            jql += f' AND updated >= "{since.strftime("%Y/%m/%d %H:%M")}"'
+        return jql + " ORDER BY updated ASC"
+
+    def needs_reconcile(self, project: str) -> bool:
+        """
+        Whether the next sync of a project should also reconcile its keys.
+        """
+        with self._lock:
+            return self._syncs.get(project, 0) % self.reconcile_every == 0
+
+    def reconcile(self, project: str, keys: Iterable[str]) -> int:
+        """
+        Drop mirrored issues of a project that are missing from ``keys``, the
+        complete list of its current issue keys (fetched after the sync).
+
+        Returns: number of issues removed
+        """
+        current = {str(key).upper() for key in keys}
+        with self._lock, self._db:
+            stored = self._db.execute("SELECT key FROM issues WHERE project = ?", (project,)).fetchall()
+            gone = [(key,) for (key,) in stored if key not in current]
+            self._db.executemany("DELETE FROM issues WHERE key = ?", gone)
+            self.removed += len(gone)
+        return len(gone)
+
+    def mark_synced(self, project: str, started_at: float) -> None:
+        """
+        Record a completed sync of a project that began at ``started_at``.
+        """
+        with self._lock:
+            self._synced_at[project] = started_at
+            self._syncs[project] = self._syncs.get(project, 0) + 1
+
+    def mark_dirty(self, projects: Optional[List[str]] = None) -> None:
+        """
+        Stop serving projects (all when None) written to by this process until
+        a sync that started afterwards has completed.
+        """
+        now = self._clock()
+        with self._lock:
+            for project in self.projects if projects is None else projects:
+                if project.upper() in self.projects:
+                    self._dirty_at[project.upper()] = now
+
+    def is_fresh(self, project: str) -> bool:
+        synced_at = self._synced_at.get(project)
+        if synced_at is None or self._clock() - synced_at > self.max_lag:
+            return False
+        return synced_at > self._dirty_at.get(project, 0.0)
+
+    def search_page(
+        self,
+        jql: str,
+        fields: List[str],
+        max_results: int,
+        page_token: Optional[str] = None,
+        account_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Answer one search page from the mirror.
+
+        Returns: a page shaped like /rest/api/3/search/jql output (with
+        mirror page tokens), or None when the query must go to Jira
+        """
+        if page_token and not page_token.startswith(MIRROR_PAGE_TOKEN):
+            return None
+        offset = int(page_token[len(MIRROR_PAGE_TOKEN):]) if page_token else 0
+        if not page_token:
+            if any(field not in MIRROR_FIELDS for field in fields):
+                self.misses += 1
+                return None
+            try:
+                query = _Query(jql, account_id).parse()
+            except ValueError:
+                self.misses += 1
+                return None
+            with self._lock:
+                servable = bool(query.projects) and all(
+                    project in self.projects and self.is_fresh(project) for project in query.projects
+                )
+            if not servable:
+                self.misses += 1
+                return None
+            self.hits += 1
+        else:
+            query = _Query(jql, account_id).parse()
+
+        marks = ", ".join("?" for _ in query.projects)
+        sql = f"SELECT data FROM issues WHERE project IN ({marks})"
+        if query.where:
+            sql += " AND " + " AND ".join(f"({condition})" for condition in query.where)
+        sql += " ORDER BY " + ", ".join(query.order or ["project DESC", "number DESC"])
+        sql += " LIMIT ? OFFSET ?"
+        with self._lock:
+            rows = self._db.execute(
+                sql, query.projects + query.params + [max_results + 1, offset]
+            ).fetchall()
+
+        more = len(rows) > max_results
+        return {
+            "issues": [json.loads(row[0]) for row in rows[:max_results]],
+            "nextPageToken": f"{MIRROR_PAGE_TOKEN}{offset + max_results}" if more else None,
+            "isLast": not more
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._db.execute("SELECT project, COUNT(*) FROM issues GROUP BY project").fetchall())
+            projects = {
+                project: {
+                    "issues": counts.get(project, 0),
+                    "synced_seconds_ago": (
+                        round(self._clock() - self._synced_at[project], 1) if project in self._synced_at else None
+                    ),
+                    "serving": self.is_fresh(project)
+                }
+                for project in self.projects
+            }
+        return {
+            "enabled": True,
+            "projects": projects,
+            "hits": self.hits,
+            "misses": self.misses,
+            "removed": self.removed
+        }
@@ -1,155 +1,114 @@
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
-from atlassian import Jira
+import threading
+from typing import Optional, List, Dict, Any, Awaitable, Iterator, TypeVar, Union
+
+from src.async_jira_client import (  # noqa: F401 - re-exported for existing imports
+    AsyncJiraClient,
+    ISSUE_INPUT_KEYS,
+    JiraClientError,
+    MAX_SEARCH_PAGE_SIZE,
+    MAX_SEARCH_RESULTS,
+    MAX_TRANSITION_HOPS,
+    SELF_ASSIGNEE_ALIASES,
+    http_status,
+)
 
 logger = logging.getLogger(__name__)
 
-class JiraClientError(Exception):
-    """Base exception for Jira client errors."""
-    pass
+T = TypeVar("T")
 
 class JiraClient:
-    
-    def __init__(self, url: str, email: str, api_token: str):
+    """
+    Blocking interface to AsyncJiraClient.
+
+    Runs one AsyncJiraClient on a private event loop thread and waits for each
+    call, so threaded callers share its connection pool, caches, rate limiter
+    and background refreshes, and every feature has a single implementation.
+    """
+
+    def __init__(self, url: str, email: str, api_token: str, **options: Any):
         """
         Initialize Jira client with credentials.
-        
+
         Args:
             url: Jira base URL
             email: Jira email
             api_token: Jira API token
-            
+            **options: Any other AsyncJiraClient argument (timeouts, pool size,
+                rate limit, caches, issue mirror, ...)
+
         Raises:
-            JiraClientError: If connection fails
+            JiraClientError: If the client cannot be configured
         """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="jira-client-loop", daemon=True)
+        self._thread.start()
         try:
-            self.jira = Jira(
-                url=url,
-                username=email,
-                password=api_token
-            )
-            self.url = url
-            self.email = email
-            logger.info(f"Jira client initialized for {email[:3]}***")
-        except Exception as e:
-            logger.error(f"Failed to initialize Jira client: {str(e)}")
-            raise JiraClientError(f"Failed to initialize Jira client: {str(e)}")
+            self.client = AsyncJiraClient(url, email, api_token, **options)
+        except Exception:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            raise
+        self.url = self.client.url
+        self.email = email
+        self._loop.call_soon_threadsafe(self.client.start_mirror_sync)
+
+    def _call(self, awaitable: Awaitable[T]) -> T:
+        """
+        Run a coroutine on the client's loop and wait for its result.
+        """
+        return asyncio.run_coroutine_threadsafe(awaitable, self._loop).result()
+
+    def close(self) -> None:
+        """
+        Close the underlying client and stop its event loop thread.
+        """
+        if not self._loop.is_running():
+            return
+        self._call(self.client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Operational counters of the client's concurrency layers.
+        """
+        return self.client.metrics()
 
     def get_current_user_account_id(self) -> str:
         """
-        Get the account ID of the currently authenticated user.
+        Get the account ID of the currently authenticated user (memoized).
         """
-        try:
-            myself = self.jira.myself()
-            account_id = myself.get("accountId")
-            if not account_id:
-                raise JiraClientError("Unable to retrieve account ID")
-            logger.info(f"Retrieved account ID: {account_id}")
-            return account_id
-        except Exception as e:
-            logger.error(f"Failed to get current user account ID: {str(e)}")
-            raise JiraClientError(f"Failed to get current user account ID: {str(e)}")
+        return self._call(self.client.get_current_user_account_id())
+
+    def refresh_current_user_account_id(self) -> str:
+        """
+        Re-fetch the authenticated user's account ID, replacing the memoized value.
+        """
+        return self._call(self.client.refresh_current_user_account_id())
+
+    def warm_up(self, connections: int = 4) -> Dict[str, Any]:
+        """
+        Open pooled connections and load cheap metadata before the first call.
+        """
+        return self._call(self.client.warm_up(connections))
 
     def create_project(
-        self, 
-        project_name: str, 
-        project_key: str, 
+        self,
+        project_name: str,
+        project_key: str,
         board_type: str = "scrum"
     ) -> Dict[str, Any]:
         """
         Create a new Jira project with an associated board.
-        
-        Note: Jira doesn't have a direct "create board" API. This creates a software
-        project with a template that automatically includes a board.
         """
-        try:
-            # Validate project key
-            if not project_key.isupper() or not (2 <= len(project_key) <= 10):
-                raise JiraClientError(
-                    "Project key must be 2-10 uppercase letters (e.g., 'PROJ', 'TEST')"
-                )
-            
-            # Get current user's account ID
-            account_id = self.get_current_user_account_id()
-            
-            # Determine project template based on board type
-            if board_type.lower() == "kanban":
-                template = "com.pyxis.greenhopper.jira:gh-kanban-template"
-            elif board_type.lower() == "scrum":
-                template = "com.pyxis.greenhopper.jira:gh-scrum-template"
-            else:
-                raise JiraClientError(
-                    f"Invalid board_type '{board_type}'. Must be 'scrum' or 'kanban'"
-                )
-            
-            payload = {
-                "key": project_key,
-                "name": project_name,
-                "projectTypeKey": "software",
-                "projectTemplateKey": template,
-                "leadAccountId": account_id,
-                "assigneeType": "UNASSIGNED"
-            }
-            
-            logger.info(f"Creating project: {project_name} ({project_key}) with {board_type} board")
-            result = self.jira.post("/rest/api/3/project", data=payload)
-            
-            # Get the board that was auto-created
-            board_info = self._get_board_for_project(project_key)
-            
-            success_response = {
-                "success": True,
-                "project_key": result.get("key"),
-                "project_id": result.get("id"),
-                "project_url": f"{self.url}/browse/{result.get('key')}",
-                "board_id": board_info.get("id"),
-                "board_url": f"{self.url}/jira/software/c/projects/{project_key}/boards/{board_info.get('id')}",
-                "board_type": board_type,
-                "message": f"Successfully created {board_type} board '{project_name}' with project key {project_key}"
-            }
-            
-            logger.info(f"Board created successfully: {success_response}")
-            return success_response
-            
-        except JiraClientError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to create board: {str(e)}")
-            raise JiraClientError(f"Failed to create board: {str(e)}")
-
-    def _get_board_for_project(self, project_key: str) -> Dict[str, Any]:
-        """
-        Get the board associated with a project.
-        """
-        try:
-            # Use Jira Agile API to get boards for project
-            response = self.jira.get(
-                f"/rest/agile/1.0/board?projectKeyOrId={project_key}"
-            )
-            boards = response.get("values", [])
-            if boards:
-                return boards[0]  # Return first board
-            return {}
-        except Exception as e:
-            logger.warning(f"Could not retrieve board info: {str(e)}")
-            return {}
+        return self._call(self.client.create_project(project_name, project_key, board_type))
 
     def get_project_key_by_name(self, project_name: str) -> str:
         """
         Fetch the project key based on the project name.
         """
-        try:
-            projects = self.jira.projects()
-            for project in projects:
-                if project.name.lower() == project_name.lower():
-                    logger.info(f"Found project: {project_name} -> {project.key}")
-                    return project.key
-            raise JiraClientError(f"Project '{project_name}' not found")
-        except JiraClientError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to get project key: {str(e)}")
-            raise JiraClientError(f"Failed to get project key: {str(e)}")
+        return self._call(self.client.get_project_key_by_name(project_name))
 
     def create_issue(
         self,
@@ -162,169 +121,115 @@ class JiraClient:
         priority: Optional[str] = None,
         labels: Optional[List[str]] = None,
         due_date: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Create a Jira issue with optional fields.
         """
-        try:
-            if not summary:
-                raise JiraClientError("Summary is required")
-            
-            # Resolve project key
-            if not project_key and project_name:
-                project_key = self.get_project_key_by_name(project_name)
-            
-            if not project_key:
-                raise JiraClientError("Either project_key or project_name must be provided")
+        return self._call(self.client.create_issue(
+            project_key=project_key,
+            project_name=project_name,
+            summary=summary,
+            description=description,
+            issue_type=issue_type,
+            assignee=assignee,
+            priority=priority,
+            labels=labels,
+            due_date=due_date,
+            idempotency_key=idempotency_key
+        ))
 
-            issue = {
-                "fields": {
-                    "project": {"key": project_key},
-                    "summary": summary,
-                    "description": description,
-                    "issuetype": {"name": issue_type}
-                }
-            }
-            
-            # optional fields
-            if assignee:
-                issue["fields"]["assignee"] = {"name": assignee}
-            if priority:
-                issue["fields"]["priority"] = {"name": priority}
-            if labels:
-                issue["fields"]["labels"] = labels
-            if due_date:
-                issue["fields"]["duedate"] = due_date
-            
-            result = self.jira.issue_create(fields=issue["fields"])
-            
-            issue_key = result.get("key")
-            return {
-                "success": True,
-                "issue_key": issue_key,
-                "issue_id": result.get("id"),
-                "issue_url": f"{self.url}/browse/{issue_key}",
-                "message": f"Successfully created issue {issue_key}"
-            }
-            
-        except JiraClientError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to create issue: {str(e)}")
-            raise JiraClientError(f"Failed to create issue: {str(e)}")
-    
-    def search_issues(self, query: str, max_results: int = 10) -> Dict[str, Any]:
+    def create_issues(
+        self,
+        issues: List[Dict[str, Any]],
+        concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
-        Search issues using JQL.
+        Create many issues through the bulk-create endpoint.
         """
-        try:
-            if not query:
-                raise JiraClientError("Query cannot be empty")
-            
-            # Use the new API v3 endpoint
-            payload = {
-                "jql": query,
-                "maxResults": max_results,
-                "fields": ["summary", "status", "assignee", "issuetype", "priority", "created"]
-            }
-            
-            results = self.jira.post("/rest/api/3/search/jql", data=payload)
-            issue_count = len(results.get('issues', []))
-            
-            # Simplify response
-            simplified_issues = []
-            for issue in results.get('issues', []):
-                assignee_data = issue.get("fields", {}).get("assignee")
-                assignee_name = assignee_data.get("displayName") if assignee_data else "Unassigned"
-                
-                simplified_issues.append({
-                    "key": issue.get("key"),
-                    "summary": issue.get("fields", {}).get("summary"),
-                    "status": issue.get("fields", {}).get("status", {}).get("name"),
-                    "assignee": assignee_name,
-                    "priority": issue.get("fields", {}).get("priority", {}).get("name", "None"),
-                    "issue_type": issue.get("fields", {}).get("issuetype", {}).get("name"),
-                    "url": f"{self.url}/browse/{issue.get('key')}"
-                })
-            
-            logger.info(f"Found {issue_count} issues")
-            return {
-                "success": True,
-                "total": results.get("total", issue_count),
-                "returned": issue_count,
-                "issues": simplified_issues
-            }
-        except Exception as e:
-            logger.error(f"Failed to search issues: {str(e)}")
-            raise JiraClientError(f"Failed to search issues: {str(e)}")
+        return self._call(self.client.create_issues(issues, concurrency))
 
-    def add_comment(self, issue_id: str, comment: str) -> Dict[str, Any]:
+    def sync_mirror(self) -> Dict[str, int]:
         """
-        Add a comment to a Jira issue.
+        Pull recently updated issues into the local issue mirror.
         """
-        try:
-            if not issue_id or not comment:
-                raise JiraClientError("Issue ID and comment are required")
-            
-            result = self.jira.issue_add_comment(issue_id, comment)
-            logger.info(f"Comment added to {issue_id}")
-            return {
-                "success": True,
-                "issue_id": issue_id,
-                "comment_id": result.get("id"),
-                "message": f"Successfully added comment to {issue_id}"
-            }
-        except Exception as e:
-            logger.error(f"Failed to add comment: {str(e)}")
-            raise JiraClientError(f"Failed to add comment: {str(e)}")
-    
-    def change_status(self, issue_id: str, new_status: str) -> Dict[str, Any]:
+        return self._call(self.client.sync_mirror())
+
+    def iter_issues(
+        self,
+        jql: str,
+        fields: Union[str, List[str], None] = None,
+        page_size: int = MAX_SEARCH_PAGE_SIZE
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Change the status/workflow state of a Jira issue.
-        Returns: Dictionary with status change response or available statuses if unsuccessful
+        Stream raw issues matching a JQL query, one page in memory at a time.
         """
+        issues = self.client.iter_issues(jql, fields, page_size)
         try:
-            if not issue_id or not new_status:
-                raise JiraClientError("Issue ID and new status are required")
+            while True:
+                try:
+                    yield self._call(issues.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._call(issues.aclose())
 
-            # Get available transitions for this issue
-            transitions_response = self.jira.get_issue_transitions(issue_id)
+    def search_issues(
+        self,
+        query: str = "",
+        max_results: int = 10,
+        cursor: Optional[str] = None,
+        fields: Union[str, List[str], None] = None
+    ) -> Dict[str, Any]:
+        """
+        Search issues using JQL, continuing from ``cursor`` when given.
+        """
+        return self._call(self.client.search_issues(query, max_results, cursor, fields))
 
-            # Handle both dict and list responses
-            if isinstance(transitions_response, dict):
-                transitions = transitions_response.get("transitions", [])
-            elif isinstance(transitions_response, list):
-                transitions = transitions_response
-            else:
-                raise JiraClientError("Unexpected response format from get_issue_transitions")
+    def get_issues(
+        self,
+        keys: List[str],
+        fields: Union[str, List[str], None] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch the current state of many issues by key.
+        """
+        return self._call(self.client.get_issues(keys, fields))
 
-            # Find the target transition
-            target = None
-            for t in transitions:
-                transition_name = t.get("name", "")
-                if isinstance(transition_name, str) and transition_name.lower() == new_status.lower():
-                    target = t
-                    break
-                
-            if not target:
-                available = [t.get("name", "Unknown") for t in transitions if isinstance(t.get("name"), str)]
-                raise JiraClientError(
-                    f"Status '{new_status}' not available. Available transitions: {', '.join(available)}"
-                )
+    def add_comment(
+        self,
+        issue_id: str,
+        comment: str,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Add a comment to a Jira issue.
+        """
+        return self._call(self.client.add_comment(issue_id, comment, idempotency_key))
 
-            # Perform the status change
-            transition_id = target.get("id")
-            result = self.jira.set_issue_status_by_transition_id(issue_id, transition_id)
-            logger.info(f"Status changed for {issue_id} to {new_status}")
-            return {
-                "success": True,
-                "issue_id": issue_id,
-                "new_status": new_status,
-                "transition_id": str(transition_id),
-                "message": f"Successfully changed {issue_id} status to {new_status}"
-            }
-        except JiraClientError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to change status: {str(e)}")
-            raise JiraClientError(f"Failed to change status: {str(e)}")
+    def add_comments(
+        self,
+        comments: List[Dict[str, str]],
+        concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Add comments to many issues concurrently.
+        """
+        return self._call(self.client.add_comments(comments, concurrency))
+
+    def change_status(self, issue_id: str, new_status: str) -> Dict[str, Any]:
+        """
+        Change the status/workflow state of a Jira issue.
+        """
+        return self._call(self.client.change_status(issue_id, new_status))
+
+    def change_status_bulk(
+        self,
+        issue_ids: List[str],
+        new_status: str,
+        concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Move many issues to the same status.
+        """
+        return self._call(self.client.change_status_bulk(issue_ids, new_status, concurrency))
@@ -0,0 +1,114 @@
+import logging
+from typing import Optional, Dict, Any
+
+try:
+    import diskcache
+except ImportError:  # optional: the persistent cache is simply disabled
+    diskcache = None
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of any cached value changes, orphaning older entries
+METADATA_CACHE_VERSION = 1
+
+# Seconds each kind of metadata is trusted after it was written to disk
+DEFAULT_METADATA_TTLS = {
+    "projects": 3600.0,
+    "users": 86400.0,
+    "boards": 86400.0,
+    "transitions": 86400.0,
+    "workflows": 86400.0,
+}
+
+
+def parse_ttls(spec: str) -> Dict[str, float]:
+    """
+    Parse a "namespace=seconds,namespace=seconds" setting, skipping malformed entries.
+    """
+    ttls = {}
+    for entry in (spec or "").split(","):
+        name, _, value = entry.partition("=")
+        try:
+            ttls[name.strip()] = float(value)
+        except ValueError:
+            continue
+    return {name: ttl for name, ttl in ttls.items() if name}
+
+
+class MetadataCache:
+    """
+    On-disk cache of slow-changing Jira metadata, so restarts come up warm.
+
+    Values are grouped in namespaces (projects, users, boards, transitions,
+    workflows), each with its own TTL. Keys embed a format version and the
+    Jira base URL, so a schema change or pointing the server at another site
+    never serves foreign entries. Without a directory, or without the
+    ``diskcache`` package, every lookup misses and writes are ignored; cache
+    errors are logged and never fail a Jira call.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str],
+        base_url: str,
+        ttls: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            directory: Cache directory, or None to disable persistence
+            base_url: Jira base URL the cached data belongs to
+            ttls: Per-namespace TTL overrides in seconds
+        """
+        self.ttls = {**DEFAULT_METADATA_TTLS, **(ttls or {})}
+        self._prefix = f"v{METADATA_CACHE_VERSION}|{base_url.rstrip('/').lower()}|"
+        self._cache = None
+        self.hits = 0
+        self.misses = 0
+        if directory and diskcache is None:
+            logger.warning("Metadata cache directory set but the 'diskcache' package is not installed")
+        elif directory:
+            self._cache = diskcache.Cache(directory)
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache is not None
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self._prefix}{namespace}|{key}"
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        if self._cache is None:
+            return None
+        try:
+            value = self._cache.get(self._key(namespace, key))
+        except Exception as e:
+            logger.warning(f"Metadata cache read failed: {str(e)}")
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        if self._cache is None or value is None:
+            return
+        try:
+            self._cache.set(self._key(namespace, key), value, expire=self.ttls.get(namespace))
+        except Exception as e:
+            logger.warning(f"Metadata cache write failed: {str(e)}")
+
+    def delete(self, namespace: str, key: str) -> None:
+        if self._cache is None:
+            return
+        try:
+            self._cache.delete(self._key(namespace, key))
+        except Exception as e:
+            logger.warning(f"Metadata cache delete failed: {str(e)}")
+
+    def close(self) -> None:
+        if self._cache is not None:
+            self._cache.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"enabled": self.enabled, "hits": self.hits, "misses": self.misses}
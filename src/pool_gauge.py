@@ -0,0 +1,44 @@
+import threading
+from typing import Dict, Any
+
+
+class PoolGauge:
+    """
+    Tracks requests in flight against the size of the HTTP connection pool.
+
+    Used as a context manager around each send. When more requests are in
+    flight than the pool has connections, the excess are waiting for a
+    connection: the pool is saturated and is what limits throughput.
+    """
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+        self.saturated_requests = 0
+
+    def __enter__(self) -> "PoolGauge":
+        with self._lock:
+            self.requests += 1
+            if self.in_flight >= self.max_connections:
+                self.saturated_requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_connections": self.max_connections,
+            "in_flight": self.in_flight,
+            "waiting": max(0, self.in_flight - self.max_connections),
+            "peak_in_flight": self.peak_in_flight,
+            "saturation": round(self.in_flight / self.max_connections, 2) if self.max_connections else None,
+            "saturated_requests": self.saturated_requests,
+            "requests": self.requests
+        }
@@ -0,0 +1,120 @@
+import threading
+import time
+from typing import Optional, List, Dict, Any, Callable
+
+
+class ProjectCatalog:
+    """
+    In-memory index of Jira projects with a time-to-live.
+
+    Keeps a case-folded name -> key map and a key -> project map so that
+    project name resolution is a dictionary hit instead of a full project
+    listing. The catalog only stores data; the owning client decides when
+    and how to (re)load it.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        miss_reload_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            ttl: Seconds before a loaded catalog is considered stale
+            miss_reload_interval: Minimum age in seconds before a lookup miss
+                is allowed to force a reload (guards against typo storms)
+            clock: Monotonic time source
+        """
+        self.ttl = ttl
+        self.miss_reload_interval = miss_reload_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._by_name: Dict[str, str] = {}
+        self._by_key: Dict[str, Dict[str, Any]] = {}
+        self._loaded_at: Optional[float] = None
+        self._expired = False
+        self._refreshing = False
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def age(self) -> float:
+        """
+        Seconds since the last full load (infinite if never loaded).
+        """
+        if self._loaded_at is None:
+            return float("inf")
+        return self._clock() - self._loaded_at
+
+    def is_stale(self) -> bool:
+        return self._expired or self.age() >= self.ttl
+
+    def should_reload_on_miss(self) -> bool:
+        return self._expired or self.age() >= self.miss_reload_interval
+
+    def load(self, projects: List[Dict[str, Any]]) -> None:
+        """
+        Replace the index with a fresh project listing.
+        """
+        by_name = {}
+        by_key = {}
+        for project in projects:
+            key = project.get("key")
+            if not key:
+                continue
+            by_key[key] = project
+            name = project.get("name")
+            if isinstance(name, str):
+                by_name[name.casefold()] = key
+        with self._lock:
+            self._by_name = by_name
+            self._by_key = by_key
+            self._loaded_at = self._clock()
+            self._expired = False
+
+    def upsert(self, project: Dict[str, Any]) -> None:
+        """
+        Add or replace a single project without reloading the whole catalog.
+        """
+        key = project.get("key")
+        if not key:
+            return
+        with self._lock:
+            previous = self._by_key.get(key)
+            if previous and isinstance(previous.get("name"), str):
+                self._by_name.pop(previous["name"].casefold(), None)
+            self._by_key[key] = project
+            if isinstance(project.get("name"), str):
+                self._by_name[project["name"].casefold()] = key
+
+    def invalidate(self) -> None:
+        """
+        Mark the catalog stale so the next lookup triggers a refresh.
+        """
+        with self._lock:
+            self._expired = True
+
+    def key_for_name(self, project_name: str) -> Optional[str]:
+        return self._by_name.get(project_name.casefold())
+
+    def project_for_key(self, project_key: str) -> Optional[Dict[str, Any]]:
+        return self._by_key.get(project_key)
+
+    def begin_refresh(self) -> bool:
+        """
+        Claim the single background refresh slot.
+
+        Returns:
+            True if the caller should run the refresh, False if one is already running
+        """
+        with self._lock:
+            if self._refreshing:
+                return False
+            self._refreshing = True
+            return True
+
+    def end_refresh(self) -> None:
+        with self._lock:
+            self._refreshing = False
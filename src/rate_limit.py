@@ -0,0 +1,156 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, Callable, Mapping
+
+# Times a throttled (429) request is queued and re-sent before the error surfaces
+MAX_RATE_LIMIT_RETRIES = 5
+
+# Pause applied after a 429 that carries no Retry-After header
+DEFAULT_RETRY_AFTER = 1.0
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Seconds to wait according to a Retry-After header (delta-seconds or HTTP date).
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+def parse_reset(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Seconds until the ISO-8601 instant in an X-RateLimit-Reset header.
+    """
+    if not value:
+        return None
+    try:
+        when = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket in front of every Jira request whose rate adapts to Jira's
+    rate-limit signals (AIMD).
+
+    Callers reserve a token before sending and sleep for the returned delay,
+    so bursts above the current rate are queued rather than rejected. Each
+    response feeds back: successes raise the rate additively, a 429 or a
+    near-limit warning cuts it multiplicatively, and Retry-After /
+    X-RateLimit-Reset pause all callers until Jira accepts requests again.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        max_rate: float = 50.0,
+        min_rate: float = 0.5,
+        burst: Optional[float] = None,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            rate: Initial requests per second
+            max_rate: Ceiling the rate may grow to
+            min_rate: Floor the rate may shrink to
+            burst: Bucket capacity (defaults to one second of the initial rate)
+            increase: Requests per second added per second's worth of successes
+            decrease: Factor applied to the rate on a 429
+            clock: Monotonic time source
+        """
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst or max(1.0, rate)
+        self.increase = increase
+        self.decrease = decrease
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self.throttled = 0
+        self.queued = 0
+        self.total_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Take a token for one request.
+
+        Returns: seconds the caller must wait before sending (0 if it may go now)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.rate, self._blocked_until - now)
+            if wait > 0:
+                self.queued += 1
+                self.total_wait += wait
+            return wait
+
+    def on_response(self, status: int, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Adapt to a response.
+
+        Returns: the delay before the request may be retried if it was
+        throttled (429), otherwise None
+        """
+        with self._lock:
+            now = self._clock()
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if status == 429:
+                self.throttled += 1
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                delay = retry_after if retry_after is not None else DEFAULT_RETRY_AFTER
+                self._blocked_until = max(self._blocked_until, now + delay)
+                self._tokens = min(self._tokens, 0.0)
+                return delay
+
+            if retry_after is not None:
+                # e.g. 503 with Retry-After: pause without treating it as over-rate
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+            remaining = headers.get("X-RateLimit-Remaining")
+            if remaining is not None and remaining.strip().lstrip("-").isdigit() and int(remaining) <= 0:
+                reset = parse_reset(headers.get("X-RateLimit-Reset"))
+                if reset is not None:
+                    self._blocked_until = max(self._blocked_until, now + reset)
+
+            if str(headers.get("X-RateLimit-NearLimit", "")).lower() == "true":
+                self.rate = max(self.min_rate, self.rate * (1 + self.decrease) / 2)
+            elif status < 500:
+                self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+            return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": round(self.rate, 2),
+            "throttled": self.throttled,
+            "queued": self.queued,
+            "total_wait_seconds": round(self.total_wait, 3)
+        }
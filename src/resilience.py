@@ -0,0 +1,155 @@
+import random
+import threading
+import time
+from typing import Dict, Any, Callable
+
+# Gateway statuses Jira Cloud returns while it is overloaded or restarting
+RETRYABLE_STATUSES = {502, 503, 504}
+
+# Methods whose repetition cannot change server state beyond the first call
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# POST endpoints that only read (search and bulk fetch), so they retry like GETs
+IDEMPOTENT_POST_PATHS = ("/search/jql", "/search", "/issue/bulkfetch")
+
+
+def is_idempotent(method: str, path: str) -> bool:
+    """
+    Whether a request may be re-sent after Jira could have processed it.
+    """
+    method = method.upper()
+    if method in IDEMPOTENT_METHODS:
+        return True
+    return method == "POST" and path.split("?", 1)[0].rstrip("/").endswith(IDEMPOTENT_POST_PATHS)
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed Jira call is retried and how long to back off.
+
+    Idempotent requests are retried on gateway errors and transport failures;
+    writes only when the request provably never reached Jira (the connection
+    could not be opened), since otherwise a retry could duplicate the write.
+    """
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 8.0):
+        """
+        Args:
+            max_retries: Retries after the first attempt
+            base_delay: Backoff ceiling in seconds for the first retry, doubled per attempt
+            max_delay: Upper bound on any single backoff
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retries = 0
+
+    def should_retry(self, attempt: int, idempotent: bool, never_sent: bool = False) -> bool:
+        """
+        Args:
+            attempt: Retries already made for this request
+            idempotent: Whether the request is safe to repeat
+            never_sent: Whether the failure happened before the request was sent
+        """
+        if attempt >= self.max_retries:
+            return False
+        return idempotent or never_sent
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Full-jitter exponential delay before retry number ``attempt`` (0-based).
+        """
+        self.retries += 1
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def stats(self) -> Dict[str, Any]:
+        return {"retries": self.retries, "max_retries": self.max_retries}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling Jira while the circuit breaker is open."""
+    pass
+
+
+class CircuitBreaker:
+    """
+    Fails Jira calls fast after repeated gateway errors or transport failures.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls raise CircuitOpenError without touching the network. Once
+    ``reset_timeout`` has passed a single probe is let through: success
+    closes the circuit, failure re-opens it for another timeout.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe
+            clock: Monotonic time source
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.rejected = 0
+        self.opened = 0
+
+    def before_call(self) -> None:
+        """
+        Admit a call, or raise CircuitOpenError while Jira is considered down.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            now = self._clock()
+            remaining = self._opened_at + self.reset_timeout - now
+            if remaining <= 0 and (self.state == self.OPEN or self._probing):
+                # Also covers a probe that was abandoned without reporting back
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                self._opened_at = now
+                return
+            self.rejected += 1
+        raise CircuitOpenError(
+            f"Jira appears to be unavailable; failing fast for {max(0.0, remaining):.0f}s"
+        )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.opened += 1
+                self.state = self.OPEN
+                self._opened_at = self._clock()
+                self._probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "opened": self.opened,
+            "rejected": self.rejected
+        }
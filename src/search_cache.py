@@ -0,0 +1,237 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Callable, Iterable, Set, Tuple
+
+# Quoted strings survive normalization untouched
+_JQL_TOKENS = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|\s+|[^\s"\']+')
+
+# Quoted strings, operators, punctuation and bare words of a JQL query
+_JQL_CLAUSE_TOKENS = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|![=~]|[=(),]|[^\s=!(),"\']+')
+
+_ISSUE_KEY = re.compile(r'^([A-Za-z][A-Za-z0-9_]*)-\d+$')
+
+_KEY_FIELDS = {"key", "issue", "issuekey"}
+
+
+def normalize_jql(jql: str) -> str:
+    """
+    Canonical form of a JQL query for cache lookups.
+
+    Collapses whitespace and case-folds everything outside quoted strings
+    (JQL keywords, field names and unquoted values are case-insensitive).
+    """
+    parts = []
+    for token in _JQL_TOKENS.findall(jql.strip()):
+        if token.isspace():
+            parts.append(" ")
+        elif token[0] in "\"'":
+            parts.append(token)
+        else:
+            parts.append(token.casefold())
+    return "".join(parts)
+
+
+def projects_in_jql(jql: str) -> Optional[Set[str]]:
+    """
+    Projects a query is confined to, from ``project =`` / ``project in``
+    clauses and ``key =`` / ``key in`` clauses on literal issue keys.
+
+    Only a plain AND conjunction of clauses is scoped: an OR, a NOT operator,
+    a negated project/key clause, a function call or a parenthesized group
+    could reach issues outside the listed projects.
+
+    Returns: the project keys or names (upper-cased), or None when the query
+    may match issues in any project
+    """
+    tokens = _JQL_CLAUSE_TOKENS.findall(jql)
+    lowered = [token.lower() for token in tokens]
+    for position in range(len(lowered) - 1):
+        if lowered[position:position + 2] == ["order", "by"]:
+            del tokens[position:], lowered[position:]
+            break
+
+    clauses: List[List[str]] = [[]]
+    previous = None
+    for position, (token, word) in enumerate(zip(tokens, lowered)):
+        if word == "or" or (word == "not" and lowered[position + 1:position + 2] != ["in"]):
+            return None
+        if token == "(" and previous != "in":
+            # A function call or a grouping
+            return None
+        if word == "and":
+            clauses.append([])
+        else:
+            clauses[-1].append(token)
+        previous = word
+
+    projects: Set[str] = set()
+    for clause in clauses:
+        field = clause[0].lower() if clause else ""
+        negated = len(clause) > 1 and (clause[1].startswith("!") or clause[1].lower() == "not")
+        if negated and (field == "project" or field in _KEY_FIELDS):
+            return None
+        if len(clause) < 3 or clause[1].lower() not in ("=", "in"):
+            continue
+        values = [token.strip("\"'") for token in clause[2:] if token not in ("(", ")", ",")]
+        if field == "project":
+            projects.update(value.upper() for value in values if value)
+        elif field in _KEY_FIELDS:
+            for value in values:
+                match = _ISSUE_KEY.match(value)
+                if match is None:
+                    return None
+                projects.add(match.group(1).upper())
+    return projects or None
+
+
+class SearchCache:
+    """
+    Short-lived cache of first search pages keyed by normalized JQL.
+
+    Entries are fresh for ``ttl`` seconds and may then be served stale for up
+    to ``stale_ttl`` more while the caller refreshes them in the background.
+    Writes made through the client invalidate the entries whose queries can
+    include the touched project; pages fetched while an invalidation happened
+    are not stored, so a racing write cannot be masked by an older result.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        stale_ttl: float = 120.0,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            ttl: Seconds an entry is served without revalidation (0 disables the cache)
+            stale_ttl: Further seconds an entry may be served while it is refreshed
+            max_entries: Entries (and queries tracked for popularity) kept
+                before the least recently used is evicted
+            clock: Monotonic time source
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Optional[Set[str]], Any]]" = OrderedDict()
+        self._refreshing: Set[str] = set()
+        self._usage: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, key: str) -> Optional[Tuple[Any, float, bool]]:
+        """
+        Returns: (value, age in seconds, fresh) or None when absent or too old
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            age = self._clock() - entry[0]
+            if age >= self.ttl + self.stale_ttl:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            fresh = age < self.ttl
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+            return entry[2], age, fresh
+
+    def put(self, key: str, projects: Optional[Set[str]], value: Any, generation: int) -> None:
+        """
+        Store a value fetched when ``generation`` was current; dropped if an
+        invalidation happened in the meantime.
+        """
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (self._clock(), projects, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, projects: Optional[Iterable[str]] = None) -> None:
+        """
+        Drop entries that may include issues of ``projects`` (all entries when None).
+        """
+        touched = None if projects is None else {p.upper() for p in projects}
+        with self._lock:
+            self.generation += 1
+            for key, (_, scope, _) in list(self._entries.items()):
+                if touched is None or scope is None or scope & touched:
+                    del self._entries[key]
+                    self.invalidations += 1
+
+    def record_use(self, key: str, query: Any) -> None:
+        """
+        Count a lookup of ``key`` towards its popularity; ``query`` is whatever
+        the caller needs to re-run it. At most ``max_entries`` queries are
+        tracked, the least recently used being forgotten first.
+        """
+        with self._lock:
+            usage = self._usage.get(key)
+            if usage is None:
+                self._usage[key] = [1, query]
+                while len(self._usage) > self.max_entries:
+                    self._usage.popitem(last=False)
+            else:
+                usage[0] += 1
+                self._usage.move_to_end(key)
+
+    def hottest(self, count: int) -> List[Tuple[str, Any]]:
+        """
+        The ``count`` most used queries as (key, query), most popular first.
+        """
+        with self._lock:
+            ranked = sorted(self._usage.items(), key=lambda item: item[1][0], reverse=True)
+            return [(key, usage[1]) for key, usage in ranked[:count]]
+
+    def decay(self) -> None:
+        """
+        Halve every popularity count, forgetting queries that drop to zero, so
+        the ranking follows recent traffic.
+        """
+        with self._lock:
+            for key, usage in list(self._usage.items()):
+                usage[0] //= 2
+                if not usage[0]:
+                    del self._usage[key]
+
+    def begin_refresh(self, key: str) -> bool:
+        """
+        Claim the background refresh of an entry; False if one is already running.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "tracked_queries": len(self._usage),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations
+        }
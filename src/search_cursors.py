@@ -0,0 +1,116 @@
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Callable
+
+
+class SearchCursor:
+    """
+    Server-held pagination state of one JQL search.
+
+    Holds the query, the requested fields, Jira's nextPageToken and any
+    issues already fetched but not yet handed out, so a follow-up call
+    continues the search instead of re-running it.
+    """
+
+    def __init__(self, cursor_id: str, jql: str, fields: List[str], lock: Any):
+        self.cursor_id = cursor_id
+        self.jql = jql
+        self.fields = fields
+        self.page_token: Optional[str] = None
+        self.page_size = 0
+        self.buffered: List[Dict[str, Any]] = []
+        self.done = False
+        self.lock = lock
+
+    @property
+    def exhausted(self) -> bool:
+        return self.done and not self.buffered
+
+    def add_page(self, page: Dict[str, Any]) -> None:
+        """
+        Append a search response page and advance the Jira page token.
+        """
+        self.buffered.extend(page.get("issues", []))
+        self.page_token = page.get("nextPageToken")
+        if not self.page_token or page.get("isLast"):
+            self.page_token = None
+            self.done = True
+
+    def take(self, count: int) -> List[Dict[str, Any]]:
+        """
+        Remove and return up to ``count`` buffered issues.
+        """
+        issues = self.buffered[:count]
+        del self.buffered[:count]
+        return issues
+
+
+class CursorStore:
+    """
+    Bounded LRU of search cursors with idle expiry.
+    """
+
+    def __init__(
+        self,
+        max_cursors: int = 256,
+        idle_ttl: float = 600.0,
+        lock_factory: Callable[[], Any] = threading.Lock,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_cursors: Cursors kept before the least recently used is evicted
+            idle_ttl: Seconds an unused cursor survives
+            lock_factory: Creates the per-cursor lock (threading or asyncio)
+            clock: Monotonic time source
+        """
+        self.max_cursors = max_cursors
+        self.idle_ttl = idle_ttl
+        self._lock_factory = lock_factory
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cursors: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    def _evict(self, now: float) -> None:
+        while self._cursors:
+            cursor_id, (last_used, _) = next(iter(self._cursors.items()))
+            if len(self._cursors) <= self.max_cursors and now - last_used < self.idle_ttl:
+                break
+            del self._cursors[cursor_id]
+
+    def create(self, jql: str, fields: List[str]) -> SearchCursor:
+        cursor = SearchCursor(secrets.token_urlsafe(12), jql, fields, self._lock_factory())
+        with self._lock:
+            now = self._clock()
+            self._cursors[cursor.cursor_id] = (now, cursor)
+            self._evict(now)
+        return cursor
+
+    def get(self, cursor_id: str) -> Optional[SearchCursor]:
+        """
+        Look up a live cursor and mark it as recently used.
+        """
+        with self._lock:
+            now = self._clock()
+            self._evict(now)
+            entry = self._cursors.pop(cursor_id, None)
+            if entry is None:
+                return None
+            self._cursors[cursor_id] = (now, entry[1])
+            return entry[1]
+
+    def buffered_count(self) -> int:
+        """
+        Issues held across all cursors, used to bound speculative prefetch.
+        """
+        with self._lock:
+            return sum(len(cursor.buffered) for _, cursor in self._cursors.values())
+
+    def discard(self, cursor_id: str) -> None:
+        with self._lock:
+            self._cursors.pop(cursor_id, None)
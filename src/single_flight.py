@@ -0,0 +1,57 @@
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+def request_key(method: str, path: str, params: Optional[Dict[str, Any]] = None, body: Any = None) -> str:
+    """
+    Canonical identity of a read request, used to spot identical calls.
+    """
+    return json.dumps([method.upper(), path.lstrip("/"), params or {}, body], sort_keys=True, default=str)
+
+
+class _Flight:
+    def __init__(self, task: "asyncio.Task"):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """
+    Collapses identical concurrent coroutine calls on one event loop.
+
+    The first caller for a key starts the function as its own task; every
+    caller, the first included, awaits that task and receives the same result
+    or exception. Results are shared between callers and must be treated as
+    read-only. Cancelling a caller only abandons its wait; the task is
+    cancelled once no caller is left waiting for it.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Flight] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        flight = self._calls.get(key)
+        if flight is None:
+            flight = self._calls[key] = _Flight(asyncio.ensure_future(fn()))
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                flight.task.cancel()
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._calls.get(key) is flight:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": len(self._calls)}
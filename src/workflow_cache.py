@@ -0,0 +1,240 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Optional, List, Dict, Any, Callable, Tuple
+
+# (project key, issue type name, current status name)
+WorkflowContext = Tuple[str, str, str]
+
+
+def normalize_transitions(raw: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """
+    Reduce the REST ``transitions`` list of an issue (``to`` being a status
+    object) to [{"id", "name", "to"}] entries.
+    """
+    transitions = []
+    for t in raw:
+        if not isinstance(t, dict) or not isinstance(t.get("name"), str):
+            continue
+        to = (t.get("to") or {}).get("name")
+        transitions.append({
+            "id": str(t.get("id")),
+            "name": t["name"],
+            "to": to if isinstance(to, str) else ""
+        })
+    return transitions
+
+
+def find_transition(transitions: List[Dict[str, str]], status: str) -> Optional[Dict[str, str]]:
+    """
+    Find the transition whose name or destination status matches ``status``.
+    """
+    wanted = status.casefold()
+    for t in transitions:
+        if t["name"].casefold() == wanted:
+            return t
+    for t in transitions:
+        if t["to"].casefold() == wanted:
+            return t
+    return None
+
+
+def project_key_of(issue_key: str) -> Optional[str]:
+    """
+    Derive the project key from an issue key such as ``PROJ-123``.
+    """
+    project, sep, number = issue_key.rpartition("-")
+    if sep and project and number.isdigit():
+        return project.upper()
+    return None
+
+
+def workflow_name_for(scheme_response: Dict[str, Any], issue_type_id: str) -> Optional[str]:
+    """
+    Pick the workflow an issue type uses from a /workflowscheme/project response.
+    """
+    for value in scheme_response.get("values", []):
+        scheme = value.get("workflowScheme", {})
+        mapped = scheme.get("issueTypeMappings", {}).get(str(issue_type_id))
+        return mapped or scheme.get("defaultWorkflow")
+    return None
+
+
+class WorkflowGraph:
+    """
+    Directed status graph of one workflow (a project/issue type pair).
+
+    Edges come from transitions observed on live issues and, when the
+    credentials allow it, from the full workflow definition. Global
+    transitions (reachable from every status) are kept separately.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._edges: Dict[str, Dict[str, Dict[str, str]]] = {}
+        self._global: Dict[str, Dict[str, str]] = {}
+        self.project_id: Optional[str] = None
+        self.issue_type_id: Optional[str] = None
+        self.definition_attempted = False
+
+    def set_transitions(self, from_status: str, transitions: List[Dict[str, str]]) -> None:
+        """
+        Replace the outgoing edges of ``from_status`` with a live observation.
+        """
+        with self._lock:
+            self._edges[from_status.casefold()] = {t["id"]: t for t in transitions if t["to"]}
+
+    def load_definition(self, workflow: Dict[str, Any]) -> None:
+        """
+        Add every transition from a /workflow/search entry (expanded with
+        transitions and statuses).
+        """
+        names = {
+            str(status.get("id")): status.get("name")
+            for status in workflow.get("statuses", [])
+            if isinstance(status.get("name"), str)
+        }
+        with self._lock:
+            for t in workflow.get("transitions", []):
+                to = names.get(str(t.get("to")))
+                if not to or not isinstance(t.get("name"), str) or t.get("type") == "initial":
+                    continue
+                edge = {"id": str(t.get("id")), "name": t["name"], "to": to}
+                sources = t.get("from") or []
+                if not sources:
+                    self._global[edge["id"]] = edge
+                for source in sources:
+                    name = names.get(str(source))
+                    if name:
+                        self._edges.setdefault(name.casefold(), {})[edge["id"]] = edge
+
+    def shortest_path(self, from_status: str, to_status: str) -> Optional[List[Dict[str, str]]]:
+        """
+        Breadth-first search for the fewest transitions from one status to another.
+
+        Returns: the transitions to perform in order ([] if already there), or
+        None if the target is not reachable with the known edges
+        """
+        start, goal = from_status.casefold(), to_status.casefold()
+        if start == goal:
+            return []
+
+        with self._lock:
+            edges = {status: list(out.values()) for status, out in self._edges.items()}
+            global_edges = list(self._global.values())
+
+        previous: Dict[str, Tuple[str, Dict[str, str]]] = {}
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            status = queue.popleft()
+            for t in edges.get(status, []) + global_edges:
+                nxt = t["to"].casefold()
+                if nxt in seen:
+                    continue
+                seen.add(nxt)
+                previous[nxt] = (status, t)
+                if nxt == goal:
+                    path = []
+                    while nxt != start:
+                        nxt, hop = previous[nxt]
+                        path.append(hop)
+                    return path[::-1]
+                queue.append(nxt)
+        return None
+
+
+class TransitionCache:
+    """
+    Cache of workflow transitions keyed by (project, issue type, status).
+
+    Alongside the transitions it remembers the last known workflow context of
+    individual issues (from searches and completed transitions), so that a
+    status change for a known issue can resolve its transition id without a
+    GET to Jira.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 3600.0,
+        max_issues: int = 10000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            ttl: Seconds a cached transition list is trusted
+            max_issues: Number of issue contexts kept (least recently used evicted)
+            clock: Monotonic time source
+        """
+        self.ttl = ttl
+        self.max_issues = max_issues
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._transitions: Dict[WorkflowContext, Tuple[float, List[Dict[str, str]]]] = {}
+        self._issues: "OrderedDict[str, WorkflowContext]" = OrderedDict()
+        self._graphs: Dict[Tuple[str, str], WorkflowGraph] = {}
+
+    def remember_issue(
+        self,
+        issue_key: str,
+        project_key: Optional[str],
+        issue_type: Optional[str],
+        status: Optional[str]
+    ) -> None:
+        """
+        Record the current workflow context of an issue; incomplete data is ignored.
+        """
+        if not (issue_key and project_key and issue_type and status):
+            return
+        with self._lock:
+            key = issue_key.upper()
+            self._issues[key] = (project_key, issue_type, status)
+            self._issues.move_to_end(key)
+            while len(self._issues) > self.max_issues:
+                self._issues.popitem(last=False)
+
+    def issue_context(self, issue_key: str) -> Optional[WorkflowContext]:
+        with self._lock:
+            key = issue_key.upper()
+            context = self._issues.get(key)
+            if context is not None:
+                self._issues.move_to_end(key)
+            return context
+
+    def forget_issue(self, issue_key: str) -> None:
+        with self._lock:
+            self._issues.pop(issue_key.upper(), None)
+
+    def store(self, context: WorkflowContext, transitions: List[Dict[str, str]]) -> None:
+        with self._lock:
+            self._transitions[context] = (self._clock(), transitions)
+        self.graph(context).set_transitions(context[2], transitions)
+
+    def graph(self, context: WorkflowContext) -> WorkflowGraph:
+        """
+        Status graph for the workflow the context belongs to (created on demand).
+        """
+        with self._lock:
+            key = (context[0], context[1])
+            graph = self._graphs.get(key)
+            if graph is None:
+                graph = self._graphs[key] = WorkflowGraph()
+            return graph
+
+    def lookup(self, context: WorkflowContext) -> Optional[List[Dict[str, str]]]:
+        """
+        Return the cached transitions for a context, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._transitions.get(context)
+            if entry is None:
+                return None
+            stored_at, transitions = entry
+            if self._clock() - stored_at >= self.ttl:
+                del self._transitions[context]
+                return None
+            return transitions
+
+    def invalidate(self, context: WorkflowContext) -> None:
+        with self._lock:
+            self._transitions.pop(context, None)
@@ -0,0 +1,41 @@
+import json
+
+import httpx
+import pytest
+
+
+class FakeJira:
+    """
+    Minimal Jira Cloud stand-in for httpx.MockTransport.
+
+    ``routes`` maps (method, path) to a JSON body, a status code, or a
+    callable taking the request and returning an httpx.Response (or a
+    coroutine resolving to one); every request is recorded in ``requests``.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content) if request.content else None
+        self.requests.append((request.method, request.url.path, body))
+        route = self.routes.get((request.method, request.url.path))
+        if route is None:
+            return httpx.Response(404, json={"errorMessages": ["not found"]})
+        if callable(route):
+            return route(request)
+        if isinstance(route, int):
+            return httpx.Response(route)
+        return httpx.Response(200, json=route)
+
+    def paths(self, method: str = None):
+        return [path for m, path, _ in self.requests if method is None or m == method]
+
+
+@pytest.fixture
+def jira():
+    fake = FakeJira()
+    fake.routes[("GET", "/rest/api/2/myself")] = {"accountId": "acc-1", "timeZone": "UTC"}
+    fake.routes[("GET", "/rest/api/2/project")] = [{"key": "AL", "name": "Alpha", "id": "10000"}]
+    return fake
@@ -0,0 +1,157 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.async_jira_client import AsyncJiraClient, JiraClientError
+
+
+def make_client(jira, **options):
+    return AsyncJiraClient(
+        "https://example.atlassian.net", "me@example.com", "token", transport=httpx.MockTransport(jira), **options
+    )
+
+
+def test_construct_and_search(jira):
+    jira.routes[("POST", "/rest/api/3/search/jql")] = {
+        "issues": [{"key": "AL-1", "fields": {"summary": "one", "status": {"name": "To Do"}}}],
+        "isLast": True
+    }
+
+    async def run():
+        client = make_client(jira)
+        try:
+            result = await client.search_issues("project = AL", max_results=5)
+            assert result["success"] is True
+            assert [issue["key"] for issue in result["issues"]] == ["AL-1"]
+            assert result["has_more"] is False
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_identical_reads_share_one_request(jira):
+    async def slow_myself(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"accountId": "acc-1"})
+
+    jira.routes[("GET", "/rest/api/2/myself")] = slow_myself
+
+    async def run():
+        client = make_client(jira)
+        try:
+            ids = await asyncio.gather(*(client.refresh_current_user_account_id() for _ in range(5)))
+            assert ids == ["acc-1"] * 5
+            assert jira.paths() == ["/rest/api/2/myself"]
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_search_limit_is_capped(jira):
+    jira.routes[("POST", "/rest/api/3/search/jql")] = lambda request: httpx.Response(200, json={
+        "issues": [{"key": f"AL-{i}", "fields": {"summary": str(i)}} for i in range(100)],
+        "nextPageToken": "more"
+    })
+
+    async def run():
+        client = make_client(jira)
+        try:
+            result = await client.search_issues("project = AL", max_results=100000, fields="minimal")
+            assert result["returned"] == 100
+            assert "total" not in result
+            assert result["has_more"] is True
+            assert len(jira.requests) == 1
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_idempotency_key_reused_for_different_content_is_rejected(jira):
+    async def post_comment(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(201, json={"id": "100"})
+
+    jira.routes[("POST", "/rest/api/2/issue/AL-1/comment")] = post_comment
+    jira.routes[("POST", "/rest/api/2/issue/AL-2/comment")] = post_comment
+
+    async def run():
+        client = make_client(jira)
+        try:
+            result = await client.add_comments([
+                {"issue_id": "AL-1", "comment": "hello", "idempotency_key": "k"},
+                {"issue_id": "AL-2", "comment": "other text", "idempotency_key": "k"},
+                {"issue_id": "AL-1", "comment": "hello", "idempotency_key": "k"},
+            ])
+            assert [r["success"] for r in result["results"]] == [True, False, True]
+            assert "different add_comment request" in result["results"][1]["error"]
+            assert jira.paths("POST") == ["/rest/api/2/issue/AL-1/comment"]
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_write_with_unknown_outcome_is_not_sent_again(jira):
+    def timeout(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    jira.routes[("POST", "/rest/api/2/issue")] = timeout
+
+    async def run():
+        client = make_client(jira)
+        try:
+            with pytest.raises(JiraClientError, match="timed out"):
+                await client.create_issue(project_key="AL", summary="once", idempotency_key="k")
+            with pytest.raises(JiraClientError, match="unknown"):
+                await client.create_issue(project_key="AL", summary="once", idempotency_key="k")
+            assert jira.paths("POST") == ["/rest/api/2/issue"]
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_rejected_write_frees_its_idempotency_key(jira):
+    responses = iter([
+        httpx.Response(400, json={"errors": {"summary": "bad"}}),
+        httpx.Response(201, json={"id": "1", "key": "AL-1"})
+    ])
+    jira.routes[("POST", "/rest/api/2/issue")] = lambda request: next(responses)
+
+    async def run():
+        client = make_client(jira)
+        try:
+            with pytest.raises(JiraClientError):
+                await client.create_issue(project_key="AL", summary="once", idempotency_key="k")
+            created = await client.create_issue(project_key="AL", summary="once", idempotency_key="k")
+            replayed = await client.create_issue(project_key="AL", summary="once", idempotency_key="k")
+            assert created["issue_key"] == replayed["issue_key"] == "AL-1"
+            assert replayed["replayed"] is True
+            assert len(jira.paths("POST")) == 2
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("jql", ['project = "Alpha"', "project = 10000"])
+def test_writes_invalidate_searches_scoped_by_project_name_or_id(jira, jql):
+    jira.routes[("POST", "/rest/api/3/search/jql")] = {"issues": [], "isLast": True}
+    jira.routes[("POST", "/rest/api/2/issue")] = lambda request: httpx.Response(201, json={"id": "1", "key": "AL-1"})
+
+    async def run():
+        client = make_client(jira, search_cache_ttl=60)
+        try:
+            await client.search_issues(jql)
+            await client.create_issue(project_key="AL", summary="new")
+            second = await client.search_issues(jql)
+            assert "cache_age_seconds" not in second
+            assert len(jira.paths("POST")) == 3
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
@@ -0,0 +1,68 @@
+import asyncio
+
+import httpx
+
+from src.async_jira_client import AsyncJiraClient
+
+
+def issue(number):
+    return {
+        "id": str(number),
+        "key": f"AL-{number}",
+        "fields": {"status": {"name": "To Do"}, "issuetype": {"name": "Task"}, "project": {"key": "AL"}}
+    }
+
+
+def bulk_jira(jira):
+    jira.routes[("POST", "/rest/api/3/issue/bulkfetch")] = {"issues": [issue(1), issue(2)]}
+    jira.routes[("GET", "/rest/api/2/issue/AL-1")] = {
+        **issue(1), "transitions": [{"id": "21", "name": "Finish", "to": {"name": "Done"}}]
+    }
+    jira.routes[("POST", "/rest/api/2/issue/AL-1/transitions")] = 204
+    jira.routes[("POST", "/rest/api/2/issue/AL-2/transitions")] = 204
+    return jira
+
+
+def change_status_bulk(jira):
+    async def run():
+        client = AsyncJiraClient(
+            "https://example.atlassian.net", "me@example.com", "token",
+            transport=httpx.MockTransport(jira), retry_attempts=0
+        )
+        try:
+            return await client.change_status_bulk(["AL-1", "AL-2"], "Done")
+        finally:
+            await client.aclose()
+
+    return asyncio.run(run())
+
+
+def test_poll_failure_reports_pending_without_resending(jira):
+    bulk_jira(jira)
+    jira.routes[("POST", "/rest/api/3/bulk/issues/transition")] = {"taskId": "77"}
+    jira.routes[("GET", "/rest/api/3/bulk/queue/77")] = 500
+
+    result = change_status_bulk(jira)
+
+    assert [r["pending"] for r in result["results"]] == [True, True]
+    assert not any(r["success"] for r in result["results"])
+    assert "/rest/api/2/issue/AL-1/transitions" not in jira.paths("POST")
+
+
+def test_unsupported_bulk_api_falls_back_to_direct_transitions(jira):
+    bulk_jira(jira)
+    jira.routes[("POST", "/rest/api/3/bulk/issues/transition")] = 404
+
+    result = change_status_bulk(jira)
+
+    assert [(r["success"], r["method"]) for r in result["results"]] == [(True, "direct"), (True, "direct")]
+
+
+def test_rejected_submission_is_reported_not_retried_per_issue(jira):
+    bulk_jira(jira)
+    jira.routes[("POST", "/rest/api/3/bulk/issues/transition")] = 400
+
+    result = change_status_bulk(jira)
+
+    assert not any(r["success"] for r in result["results"])
+    assert "/rest/api/2/issue/AL-2/transitions" not in jira.paths("POST")
@@ -0,0 +1,33 @@
+import asyncio
+
+from src.dispatch import ToolDispatcher, parse_tool_limits
+
+
+async def slow(results, value):
+    await asyncio.sleep(0.01)
+    results.append(value)
+    return value
+
+
+def test_uncapped_tools_run_concurrently():
+    async def run():
+        dispatcher = ToolDispatcher()
+        results = []
+        assert await asyncio.gather(*(dispatcher.run("search", slow, results, i) for i in range(5))) == list(range(5))
+        assert dispatcher.stats()["tools"]["search"] == {
+            "limit": None, "calls": 5, "in_flight": 0, "queued": 0, "peak_queued": 0
+        }
+
+    asyncio.run(run())
+
+
+def test_capped_tool_queues_excess_calls():
+    async def run():
+        dispatcher = ToolDispatcher(limits=parse_tool_limits("search=2, bad, other=x"))
+        results = []
+        await asyncio.gather(*(dispatcher.run("search", slow, results, i) for i in range(5)))
+        stats = dispatcher.stats()["tools"]["search"]
+        assert stats["limit"] == 2
+        assert stats["peak_queued"] == 3
+
+    asyncio.run(run())
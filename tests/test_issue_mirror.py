@@ -0,0 +1,115 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.async_jira_client import AsyncJiraClient
+from src.issue_mirror import MIRROR_FIELDS, IssueMirror
+
+FIELDS = ["summary", "status"]
+
+
+def issue(key, assignee=None, resolution=None, labels=(), status="To Do"):
+    return {
+        "key": key,
+        "id": key.split("-")[1],
+        "fields": {
+            "summary": key,
+            "status": {"name": status, "id": "10001"},
+            "assignee": assignee and {"accountId": assignee, "displayName": assignee.title()},
+            "resolution": resolution and {"name": resolution},
+            "labels": list(labels),
+            "created": "2024-01-01T00:00:00.000+0000",
+            "updated": "2024-01-02T00:00:00.000+0000"
+        }
+    }
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = IssueMirror(str(tmp_path / "mirror.db"), ["AL"])
+    mirror.upsert([
+        issue("AL-1"),
+        issue("AL-2", assignee="x1", labels=["a"]),
+        issue("AL-3", assignee="me", resolution="Done", status="Done", labels=["b"]),
+    ])
+    mirror.mark_synced("AL", mirror._clock())
+    yield mirror
+    mirror.close()
+
+
+def keys(mirror, jql):
+    page = mirror.search_page(jql + " ORDER BY key ASC", FIELDS, 50, account_id="me")
+    return None if page is None else [issue["key"] for issue in page["issues"]]
+
+
+@pytest.mark.parametrize("jql, expected", [
+    ("project = AL AND resolution = Unresolved", ["AL-1", "AL-2"]),
+    ("project = AL AND resolution != Unresolved", ["AL-3"]),
+    ("project = AL AND assignee = EMPTY", ["AL-1"]),
+    ("project = AL AND assignee in (EMPTY, x1)", ["AL-1", "AL-2"]),
+    ("project = AL AND assignee not in (EMPTY, x1)", ["AL-3"]),
+    ("project = AL AND assignee != x1", ["AL-3"]),
+    ("project = AL AND assignee = currentUser() AND resolution = Unresolved", []),
+    ("project = AL AND labels = a", ["AL-2"]),
+    ("project = AL AND labels is EMPTY", ["AL-1"]),
+    ("project = AL AND labels is not EMPTY", ["AL-2", "AL-3"]),
+])
+def test_supported_queries_match_jql_semantics(mirror, jql, expected):
+    assert keys(mirror, jql) == expected
+
+
+@pytest.mark.parametrize("jql", [
+    "project = AL AND labels != a",
+    "project = AL AND labels not in (a)",
+    "project = AL AND status = 10001",
+    "project = AL AND priority = 3",
+    "project = AL OR assignee = x1",
+    "project = AL AND assignee in membersOf(team)",
+    "status = Done",
+])
+def test_unsupported_queries_go_to_jira(mirror, jql):
+    assert keys(mirror, jql) is None
+
+
+def test_reconcile_drops_issues_no_longer_in_the_project(mirror):
+    assert mirror.needs_reconcile("AL") is False
+    assert mirror.reconcile("AL", ["al-1", "AL-3", "AL-9"]) == 1
+    assert keys(mirror, "project = AL") == ["AL-1", "AL-3"]
+    assert mirror.stats()["removed"] == 1
+
+
+def test_sync_reconciles_on_first_sync_and_every_n_syncs(jira, tmp_path):
+    listed = {"keys": ["AL-1", "AL-2"]}
+
+    def search(request):
+        body = jira.requests[-1][2]
+        if body["fields"] == ["id"]:
+            return httpx.Response(200, json={"issues": [{"key": key} for key in listed["keys"]], "isLast": True})
+        return httpx.Response(200, json={"issues": [issue("AL-1"), issue("AL-2")], "isLast": True})
+
+    jira.routes[("POST", "/rest/api/3/search/jql")] = search
+
+    async def run():
+        client = AsyncJiraClient(
+            "https://example.atlassian.net", "me@example.com", "token", transport=httpx.MockTransport(jira),
+            mirror_path=str(tmp_path / "mirror.db"), mirror_projects=["AL"], mirror_reconcile_every=2
+        )
+        try:
+            listed["keys"] = ["AL-1"]
+            await client.sync_mirror()
+            assert client.mirror.stats()["projects"]["AL"]["issues"] == 1
+
+            jira.routes[("POST", "/rest/api/3/search/jql")] = lambda request: httpx.Response(
+                200, json={"issues": [], "isLast": True}
+            )
+            await client.sync_mirror()
+            assert jira.requests[-1][2]["fields"] == MIRROR_FIELDS
+
+            await client.sync_mirror()
+            assert jira.requests[-1][2]["fields"] == ["id"]
+            assert client.mirror.stats()["projects"]["AL"]["issues"] == 0
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
@@ -0,0 +1,23 @@
+import httpx
+
+from src.jira_client import JiraClient
+
+
+def test_blocking_client_runs_calls_through_the_async_client(jira):
+    pages = {
+        None: {"issues": [{"key": "AL-1", "fields": {"summary": "one"}}], "nextPageToken": "p2"},
+        "p2": {"issues": [{"key": "AL-2", "fields": {"summary": "two"}}], "isLast": True},
+    }
+    jira.routes[("POST", "/rest/api/3/search/jql")] = lambda request: httpx.Response(
+        200, json=pages[jira.requests[-1][2].get("nextPageToken")]
+    )
+    client = JiraClient(
+        "https://example.atlassian.net", "me@example.com", "token", transport=httpx.MockTransport(jira)
+    )
+    try:
+        assert client.get_current_user_account_id() == "acc-1"
+        assert client.get_project_key_by_name("alpha") == "AL"
+        assert [issue["key"] for issue in client.iter_issues("project = AL", fields="minimal")] == ["AL-1", "AL-2"]
+        assert client.metrics()["connection_pool"]["requests"] == len(jira.requests)
+    finally:
+        client.close()
@@ -0,0 +1,129 @@
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from src.async_jira_client import AsyncJiraClient
+from src.rate_limit import DEFAULT_RETRY_AFTER, AdaptiveRateLimiter, parse_reset, parse_retry_after
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("3", 3.0),
+    (" 1.5 ", 1.5),
+    ("-4", 0.0),
+    ("Mon, 01 Jan 2024 12:00:10 GMT", 10.0),
+    ("Mon, 01 Jan 2024 11:59:00 GMT", 0.0),
+    ("soon", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value, now=NOW) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2024-01-01T12:00:30Z", 30.0),
+    ("2024-01-01T12:00:30+00:00", 30.0),
+    ("2024-01-01T12:00:30", 30.0),
+    ("2024-01-01T11:00:00Z", 0.0),
+    ("later", None),
+    (None, None),
+])
+def test_parse_reset(value, expected):
+    assert parse_reset(value, now=NOW) == expected
+
+
+def test_bucket_queues_requests_above_the_rate():
+    clock = Clock()
+    limiter = AdaptiveRateLimiter(rate=2.0, clock=clock)
+    assert [limiter.reserve(), limiter.reserve()] == [0.0, 0.0]
+    assert limiter.reserve() == pytest.approx(0.5)
+    assert limiter.reserve() == pytest.approx(1.0)
+    clock.now += 2.0
+    assert limiter.reserve() == 0.0
+    assert limiter.stats()["queued"] == 2
+
+
+def test_throttle_cuts_the_rate_and_pauses_every_caller():
+    clock = Clock()
+    limiter = AdaptiveRateLimiter(rate=8.0, clock=clock)
+    assert limiter.on_response(429, {"Retry-After": "3"}) == 3.0
+    assert limiter.rate == 4.0
+    assert limiter.reserve() == pytest.approx(3.0)
+    assert limiter.on_response(429, {}) == DEFAULT_RETRY_AFTER
+    assert limiter.rate == 2.0
+    assert limiter.stats()["throttled"] == 2
+
+
+def test_rate_grows_additively_and_stays_within_bounds():
+    limiter = AdaptiveRateLimiter(rate=1.0, max_rate=1.5, min_rate=0.5, clock=Clock())
+    assert limiter.on_response(200, {}) is None
+    assert limiter.rate == 1.5
+    limiter.on_response(200, {})
+    assert limiter.rate == 1.5
+    limiter.on_response(503, {})
+    assert limiter.rate == 1.5
+    for _ in range(3):
+        limiter.on_response(429, {"Retry-After": "0"})
+    assert limiter.rate == 0.5
+
+
+def test_near_limit_warning_slows_down_without_a_pause():
+    limiter = AdaptiveRateLimiter(rate=8.0, clock=Clock())
+    assert limiter.on_response(200, {"X-RateLimit-NearLimit": "true"}) is None
+    assert limiter.rate == 6.0
+    assert limiter.reserve() == 0.0
+
+
+def test_exhausted_quota_pauses_until_reset():
+    clock = Clock()
+    limiter = AdaptiveRateLimiter(rate=10.0, clock=clock)
+    reset = datetime.now(timezone.utc).timestamp() + 60
+    headers = {
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": datetime.fromtimestamp(reset, timezone.utc).isoformat()
+    }
+    limiter.on_response(200, headers)
+    assert 58 < limiter.reserve() <= 60
+
+
+def test_retry_after_on_a_gateway_error_pauses_without_cutting_the_rate():
+    clock = Clock()
+    limiter = AdaptiveRateLimiter(rate=10.0, clock=clock)
+    assert limiter.on_response(503, {"Retry-After": "5"}) is None
+    assert limiter.rate == 10.0
+    assert limiter.reserve() == pytest.approx(5.0)
+
+
+def test_throttled_request_is_sent_again(jira):
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"version": "1"})
+    ])
+    jira.routes[("GET", "/rest/api/2/serverInfo")] = lambda request: next(responses)
+
+    async def run():
+        client = AsyncJiraClient(
+            "https://example.atlassian.net", "me@example.com", "token", transport=httpx.MockTransport(jira)
+        )
+        try:
+            assert await client._send("GET", "/rest/api/2/serverInfo") == {"version": "1"}
+            assert len(jira.requests) == 2
+            assert client.rate_limiter.stats()["throttled"] == 1
+            assert client.circuit_breaker.stats()["consecutive_failures"] == 0
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
@@ -0,0 +1,127 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.async_jira_client import AsyncJiraClient
+from src.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, is_idempotent
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_client(jira, **options):
+    client = AsyncJiraClient(
+        "https://example.atlassian.net", "me@example.com", "token", transport=httpx.MockTransport(jira), **options
+    )
+    client.retry_policy.base_delay = 0
+    return client
+
+
+def test_retried_call_counts_as_one_breaker_failure(jira):
+    jira.routes[("GET", "/rest/api/2/serverInfo")] = 503
+
+    async def run():
+        client = make_client(jira, retry_attempts=3, circuit_failure_threshold=5)
+        try:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client._send("GET", "/rest/api/2/serverInfo")
+            assert len(jira.requests) == 4
+            assert client.circuit_breaker.stats()["consecutive_failures"] == 1
+            assert client.circuit_breaker.state == "closed"
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_gateway_errors_are_retried_until_success(jira):
+    responses = iter([httpx.Response(503), httpx.Response(503), httpx.Response(200, json={"version": "1"})])
+    jira.routes[("GET", "/rest/api/2/serverInfo")] = lambda request: next(responses)
+
+    async def run():
+        client = make_client(jira)
+        try:
+            assert await client._send("GET", "/rest/api/2/serverInfo") == {"version": "1"}
+            assert len(jira.requests) == 3
+            assert client.retry_policy.stats()["retries"] == 2
+            assert client.circuit_breaker.stats()["consecutive_failures"] == 0
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("method, path, expected", [
+    ("GET", "/rest/api/2/issue/AL-1", True),
+    ("put", "/rest/api/2/issue/AL-1", True),
+    ("POST", "/rest/api/3/search/jql", True),
+    ("POST", "/rest/api/3/issue/bulkfetch?x=1", True),
+    ("POST", "/rest/api/2/issue", False),
+    ("POST", "/rest/api/2/issue/AL-1/comment", False),
+])
+def test_is_idempotent(method, path, expected):
+    assert is_idempotent(method, path) is expected
+
+
+def test_retry_policy_only_repeats_safe_requests():
+    policy = RetryPolicy(max_retries=2, base_delay=1.0, max_delay=3.0)
+    assert policy.should_retry(0, idempotent=True)
+    assert not policy.should_retry(2, idempotent=True)
+    assert not policy.should_retry(0, idempotent=False)
+    assert policy.should_retry(0, idempotent=False, never_sent=True)
+    assert all(0 <= policy.backoff(attempt) <= min(3.0, 2 ** attempt) for attempt in range(5))
+    assert policy.stats()["retries"] == 5
+
+
+def test_breaker_opens_probes_and_closes():
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0, clock=clock)
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now += 10.0
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+    assert breaker.stats() == {"state": "closed", "consecutive_failures": 0, "opened": 1, "rejected": 2}
+
+
+def test_failed_probe_reopens_the_breaker():
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+    breaker.record_failure()
+    clock.now += 10.0
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.stats()["opened"] == 2
+
+
+def test_abandoned_probe_is_replaced_after_the_timeout():
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+    breaker.record_failure()
+    clock.now += 10.0
+    breaker.before_call()
+    clock.now += 10.0
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
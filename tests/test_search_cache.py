@@ -0,0 +1,39 @@
+import pytest
+
+from src.search_cache import SearchCache, normalize_jql, projects_in_jql
+
+
+@pytest.mark.parametrize("jql, expected", [
+    ("project = ABC", {"ABC"}),
+    ('project in (ABC, "xyz") AND status = Done ORDER BY key', {"ABC", "XYZ"}),
+    ("project = ABC AND status != Done AND labels not in (x)", {"ABC"}),
+    ("project != ABC", None),
+    ("NOT project = ABC", None),
+    ("key in (ABC-1, XYZ-2)", {"ABC", "XYZ"}),
+    ("project = ABC OR assignee = currentUser()", None),
+    ("project in projectsLeadByUser()", None),
+    ("issue in linkedIssues(ABC-1)", None),
+    ("parent = ABC-1", None),
+    ("project not in (ABC)", None),
+    ("(project = ABC AND status = Done)", None),
+    ("key = 10001", None),
+    ("project = A AND labels = order OR project = B", None),
+    ("project = A AND labels = order ORDER BY key", {"A"}),
+    ("", None),
+])
+def test_projects_in_jql(jql, expected):
+    assert projects_in_jql(jql) == expected
+
+
+def test_normalize_jql_keeps_quoted_text():
+    assert normalize_jql('Project  =  ABC AND summary ~ "Hello World"') == 'project = abc and summary ~ "Hello World"'
+
+
+def test_tracked_queries_are_capped():
+    cache = SearchCache(max_entries=3)
+    for number in range(5):
+        cache.record_use(f"q{number}", number)
+    cache.record_use("q2", 2)
+    cache.record_use("q5", 5)
+    assert cache.stats()["tracked_queries"] == 3
+    assert [key for key, _ in cache.hottest(3)] == ["q2", "q4", "q5"]
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from src.single_flight import AsyncSingleFlight
+
+
+def test_cancelling_the_leader_does_not_fail_followers():
+    async def run():
+        flight = AsyncSingleFlight()
+        started = []
+
+        async def fetch():
+            started.append(1)
+            await asyncio.sleep(0.01)
+            return "page"
+
+        leader = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "page"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert started == [1]
+        assert flight.stats() == {"calls": 2, "coalesced": 1, "in_flight": 0}
+
+    asyncio.run(run())
+
+
+def test_call_is_cancelled_when_every_caller_gives_up():
+    async def run():
+        flight = AsyncSingleFlight()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+    asyncio.run(run())
+
+
+def test_errors_reach_every_caller():
+    async def run():
+        flight = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+        assert [type(r) for r in results] == [ValueError, ValueError]
+
+    asyncio.run(run())
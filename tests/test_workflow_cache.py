@@ -0,0 +1,115 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.async_jira_client import AsyncJiraClient, JiraClientError
+from src.workflow_cache import WorkflowGraph, normalize_transitions
+
+WORKFLOW = {
+    "statuses": [
+        {"id": "1", "name": "To Do"},
+        {"id": "3", "name": "In Progress"},
+        {"id": "4", "name": "Review"},
+        {"id": "5", "name": "Done"},
+        {"id": "6", "name": "Blocked"},
+    ],
+    "transitions": [
+        {"id": "1", "name": "Create", "to": "1", "type": "initial"},
+        {"id": "11", "name": "Start", "from": ["1"], "to": "3"},
+        {"id": "21", "name": "Submit", "from": ["3"], "to": "4"},
+        {"id": "31", "name": "Approve", "from": ["4"], "to": "5"},
+        {"id": "41", "name": "Finish", "from": ["3"], "to": "5"},
+        {"id": "51", "name": "Reopen", "from": [], "to": "1"},
+    ],
+}
+
+
+def route(graph):
+    return [(hop["id"], hop["to"]) for hop in graph]
+
+
+def test_shortest_path_over_observed_and_defined_transitions():
+    graph = WorkflowGraph()
+    graph.set_transitions("To Do", [{"id": "11", "name": "Start", "to": "In Progress"}])
+    assert graph.shortest_path("to do", "To Do") == []
+    assert route(graph.shortest_path("To Do", "in progress")) == [("11", "In Progress")]
+    assert graph.shortest_path("To Do", "Done") is None
+
+    graph.load_definition(WORKFLOW)
+    assert route(graph.shortest_path("To Do", "Done")) == [("11", "In Progress"), ("41", "Done")]
+    assert route(graph.shortest_path("Done", "In Progress")) == [("51", "To Do"), ("11", "In Progress")]
+    assert graph.shortest_path("Done", "Blocked") is None
+
+
+def test_live_observation_replaces_defined_edges():
+    graph = WorkflowGraph()
+    graph.load_definition(WORKFLOW)
+    graph.set_transitions("In Progress", [{"id": "21", "name": "Submit", "to": "Review"}])
+    assert route(graph.shortest_path("To Do", "Done")) == [("11", "In Progress"), ("21", "Review"), ("31", "Done")]
+
+
+def test_normalize_transitions():
+    raw = [
+        {"id": 11, "name": "Start", "to": {"id": "3", "name": "In Progress"}},
+        {"id": "21", "name": "Odd", "to": None},
+        {"name": None},
+    ]
+    assert normalize_transitions(raw) == [
+        {"id": "11", "name": "Start", "to": "In Progress"},
+        {"id": "21", "name": "Odd", "to": ""},
+    ]
+
+
+def test_rejected_hop_replans_once(jira):
+    status = {"name": "To Do"}
+    live = {
+        "To Do": [{"id": "11", "name": "Start", "to": {"name": "In Progress"}}],
+        "In Progress": [{"id": "21", "name": "Submit", "to": {"name": "Review"}}],
+    }
+    moves = {"11": "In Progress", "21": "Review", "31": "Done"}
+
+    def get_issue(request):
+        return httpx.Response(200, json={
+            "key": "AL-1",
+            "fields": {
+                "status": dict(status),
+                "project": {"key": "AL", "id": "10000"},
+                "issuetype": {"name": "Task", "id": "10001"}
+            },
+            "transitions": live[status["name"]]
+        })
+
+    def post_transition(request):
+        transition_id = jira.requests[-1][2]["transition"]["id"]
+        if transition_id not in moves:
+            return httpx.Response(400, json={"errorMessages": ["Transition not valid"]})
+        status["name"] = moves[transition_id]
+        return httpx.Response(204)
+
+    jira.routes[("GET", "/rest/api/2/issue/AL-1")] = get_issue
+    jira.routes[("POST", "/rest/api/2/issue/AL-1/transitions")] = post_transition
+    jira.routes[("GET", "/rest/api/3/workflowscheme/project")] = {
+        "values": [{"workflowScheme": {"defaultWorkflow": "Software"}}]
+    }
+    jira.routes[("GET", "/rest/api/3/workflow/search")] = {"values": [WORKFLOW]}
+
+    async def run():
+        client = AsyncJiraClient(
+            "https://example.atlassian.net", "me@example.com", "token", transport=httpx.MockTransport(jira)
+        )
+        try:
+            result = await client.change_status("AL-1", "Done")
+            assert [hop["to"] for hop in result["path"]] == ["In Progress", "Review", "Done"]
+            posted = [body["transition"]["id"] for method, path, body in jira.requests if method == "POST"]
+            assert posted == ["11", "41", "21", "31"]
+            assert jira.paths("GET").count("/rest/api/2/issue/AL-1") == 2
+
+            status["name"] = "To Do"
+            moves.pop("21")
+            with pytest.raises(JiraClientError, match="after reaching 'In Progress'"):
+                await client.change_status("AL-1", "Done")
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())